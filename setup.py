@@ -66,4 +66,5 @@ setuptools.setup(
     ],
     package_dir={"": "src"},
     packages=setuptools.find_packages("src"),
+    extras_require={"numpy": ["numpy"]},
 )
@@ -23,12 +23,20 @@ Contents:
 
   * RoundingMethods -- a list of available rounding methods
   * NatDivision -- long division of natural numbers and its inverse
+  * DigitIterator -- lazily generated fractional digits of a division
   * BasesError -- supertype of errors raised by package methods
+  * CachePolicies -- a list of eviction policies for caches
+  * NatArrays -- conversion and division of many natural numbers at once,
+    using NumPy
   * Nats
 
     - conversion between non-negative ints and sequences
     - conversion between sequences in one base to sequences in another
+  * Periods -- lengths of the parts of fractions, with caches of
+    factorizations and orders
+  * Powers -- the cache of powers of bases shared by all conversions
   * Radix -- representation of rational number as string of digits
+  * FrozenRadix -- an immutable, hashable Radix
   * Rationals
 
     - conversion between Rational and Radix objects
@@ -36,11 +44,16 @@ Contents:
   * String -- display of Radices
 """
 
+from ._arrays import NatArrays
+from ._cache import CacheInfo, CachePolicies
 from ._config import BaseConfig, BasesConfig, DigitsConfig, DisplayConfig, StripConfig
 from ._constants import RoundingMethods
 from ._display import String
-from ._division import NatDivision
+from ._division import DigitIterator, NatDivision
 from ._errors import BasesError
 from ._nats import Nats
-from ._rationals import Radices, Radix, Rationals
+from ._periods import Periods
+from ._powers import Powers, PowersInfo
+from ._radix import FrozenRadix, Radix
+from ._rationals import Radices, Rationals
 from .version import __version__
@@ -0,0 +1,271 @@
+# Copyright (C) 2015 - 2019 Red Hat, Inc.
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or any later version.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; If not, see <http://www.gnu.org/licenses/>.
+#
+# Red Hat Author(s): Anne Mulhern <amulhern@redhat.com>
+# Other Author(s): Anne Mulhern <mulhern@cs.wisc.edu>
+
+"""
+Methods dealing with many natural numbers at once, using NumPy.
+"""
+
+# isort: STDLIB
+import math
+
+from ._division import NatDivision
+from ._errors import BasesImportError, BasesValueError
+from ._nats import Nats
+from ._periods import Periods
+
+
+def _numpy():
+    """
+    The numpy module, imported on first use, so that importing justbases
+    does not import NumPy.
+
+    :returns: the numpy module
+    :raises BasesImportError: if NumPy is not installed
+    """
+    try:
+        # isort: THIRDPARTY
+        import numpy  # pylint: disable=import-outside-toplevel
+    except ImportError as err:  # pragma: no cover
+        raise BasesImportError(
+            "NumPy is required by NatArrays; install justbases[numpy]"
+        ) from err
+    return numpy
+
+
+class NatArrays:
+    """
+    Methods to convert and divide arrays of non-negative ints.
+
+    Every method requires NumPy, which is imported on first use.
+    """
+
+    # The largest value that a chunk of digits may have.
+    _CHUNK_LIMIT = 2**64
+
+    # The bound on denominator * base for a division to be done in int64.
+    _INT64_LIMIT = 2**63
+
+    # Divisions with more fractional digits than this are done one at a
+    # time, rather than holding up the whole batch.
+    _LOCKSTEP_MAX_DIGITS = 2**12
+
+    @classmethod
+    def _chunk_width(cls, base):
+        """
+        The number of digits in ``base`` that fit in a uint64.
+
+        :param int base: the base, must be at least 2
+        :returns: the greatest width, w, such that base**w <= 2**64
+        :rtype: int
+        """
+        width = 1
+        while base ** (width + 1) <= cls._CHUNK_LIMIT:
+            width += 1
+        return width
+
+    @classmethod
+    def convert_to_int(cls, value, from_base):
+        """
+        Convert every row of a matrix of digits to an int.
+
+        :param value: the digits, one number per row
+        :type value: two-dimensional array of int, e.g., of uint8 or uint16
+        :param int from_base: base of value
+        :returns: the conversion result, one int per row
+        :rtype: list of int
+        :raises BasesValueError: if from_base is less than 2
+        :raises BasesValueError: if value is not a matrix of ints
+        :raises BasesValueError: if elements in value outside bounds
+        :raises BasesImportError: if NumPy is not installed
+
+        Every row is split into chunks of digits small enough that the
+        value of each chunk fits in a uint64. The chunks of all rows are
+        evaluated at once, by multiplying against a vector of powers of
+        from_base, and the chunk values are then combined.
+
+        Complexity: O(number of digits in value) NumPy operations
+        """
+        if from_base < 2:
+            raise BasesValueError(from_base, "from_base", "must be at least 2")
+
+        numpy = _numpy()
+        value = numpy.asarray(value)
+        if value.ndim != 2 or value.dtype.kind not in "iu":
+            raise BasesValueError(value, "value", "must be a matrix of ints")
+
+        if value.size != 0 and (value.min() < 0 or value.max() >= from_base):
+            raise BasesValueError(
+                value,
+                "value",
+                f"elements must be at least 0 and less than {from_base}",
+            )
+
+        (rows, columns) = value.shape
+        width = cls._chunk_width(from_base)
+        powers = numpy.array(
+            [from_base**i for i in range(width - 1, -1, -1)], dtype=numpy.uint64
+        )
+
+        multiplier = from_base**width
+        result = None
+        start = 0
+        for end in range(columns % width or width, columns + 1, width):
+            chunk = value[:, start:end].astype(numpy.uint64) @ powers[start - end :]
+            if result is None:
+                result = chunk
+            else:
+                result = result.astype(object, copy=False) * multiplier
+                result += chunk.astype(object)
+            start = end
+
+        if result is None:
+            return rows * [0]
+
+        return result.tolist()
+
+    @staticmethod
+    def _check_divisions(numerators, denominators, base):
+        """
+        Check the operands of many divisions.
+
+        :param numerators: the dividends
+        :type numerators: sequence of int
+        :param denominators: the divisors
+        :type denominators: sequence of int
+        :param int base: the base
+        :raises BasesValueError: if the operands are invalid
+        """
+        if base < 2:
+            raise BasesValueError(base, "base", "must be at least 2")
+
+        if len(numerators) != len(denominators):
+            raise BasesValueError(
+                denominators, "denominators", "must be as many as numerators"
+            )
+
+        if any(numerator < 0 for numerator in numerators):
+            raise BasesValueError(numerators, "numerators", "must be at least 0")
+
+        if any(denominator < 1 for denominator in denominators):
+            raise BasesValueError(denominators, "denominators", "must be at least 1")
+
+    @classmethod
+    def _plan_division(cls, numerator, denominator, base):
+        """
+        Find how to divide numerator by denominator in lockstep.
+
+        :param int numerator: the dividend, at least 0
+        :param int denominator: the divisor, at least 1
+        :param int base: the base, at least 2
+        :returns: the number of fractional digits, the integer part, the
+           remainder, the denominator and the length of the non-repeating
+           part, or None if the division must be done on its own
+        :rtype: tuple of int * int * int * int * int or NoneType
+        """
+        if denominator * base >= cls._INT64_LIMIT:
+            return None
+
+        (integer, remainder) = divmod(numerator, denominator)
+        (start, cofactor) = Periods.pre_period(
+            denominator // math.gcd(remainder, denominator), base
+        )
+        if start > cls._LOCKSTEP_MAX_DIGITS:
+            return None
+
+        if cofactor == 1:
+            period = 0
+        else:
+            period = Periods.order(base, cofactor, cls._LOCKSTEP_MAX_DIGITS - start)
+            if period is None:
+                return None
+
+        return (start + period, integer, remainder, denominator, start)
+
+    @classmethod
+    def division_int(cls, numerators, denominators, base):
+        """
+        Divide many natural numbers, given as ints, at once.
+
+        :param numerators: the dividends, each at least 0
+        :type numerators: sequence of int
+        :param denominators: the divisors, each at least 1
+        :type denominators: sequence of int
+        :param int base: the base of the results
+        :returns: the result of each division, as for NatDivision.division
+        :rtype: list of (list of int * list of int * list of int * int)
+        :raises BasesValueError: if base is less than 2
+        :raises BasesValueError: if the sequences differ in length
+        :raises BasesValueError: if any numerator or denominator is invalid
+        :raises BasesImportError: if NumPy is not installed
+
+        The number of fractional digits of each division is found from its
+        denominator. The remainders of all the divisions are then held in
+        an int64 array and every division advances by one digit at each
+        step. Divisions are dropped from the array once all their digits
+        are found.
+
+        Divisions where denominator * base does not fit in an int64, or
+        with more than _LOCKSTEP_MAX_DIGITS fractional digits, are done one
+        at a time.
+
+        Complexity: O(greatest number of fractional digits) NumPy operations
+        """
+        # pylint: disable=too-many-locals
+        cls._check_divisions(numerators, denominators, base)
+
+        numpy = _numpy()
+        result = len(numerators) * [None]
+        rows = []
+        for (index, (numerator, denominator)) in enumerate(
+            zip(numerators, denominators)
+        ):
+            row = cls._plan_division(numerator, denominator, base)
+            if row is None:
+                result[index] = NatDivision.division_int(numerator, denominator, base)
+            else:
+                rows.append((row[0], index) + row[1:])
+
+        # Longest divisions first, so that those still in progress at every
+        # step are a prefix of the arrays.
+        rows.sort(key=lambda row: row[0], reverse=True)
+        lengths = [row[0] for row in rows]
+        offsets = numpy.cumsum([0] + lengths[:-1], dtype=numpy.int64)
+        remainders = numpy.array([row[3] for row in rows], dtype=numpy.int64) * base
+        divisors = numpy.array([row[4] for row in rows], dtype=numpy.int64)
+        digits = numpy.empty(sum(lengths), dtype=numpy.int64)
+
+        active = len(rows)
+        for step in range(lengths[0] if rows else 0):
+            while lengths[active - 1] <= step:
+                active -= 1
+            (quotients, remainders[:active]) = numpy.divmod(
+                remainders[:active], divisors[:active]
+            )
+            remainders[:active] *= base
+            digits[offsets[:active] + step] = quotients
+
+        for (row, offset) in zip(rows, offsets.tolist()):
+            (length, index, integer, _, _, start) = row
+            fraction = digits[offset : offset + length].tolist()
+            result[index] = (
+                Nats.convert_from_int(integer, base),
+                fraction[:start],
+                fraction[start:],
+                0,
+            )
+        return result
@@ -0,0 +1,323 @@
+# Copyright (C) 2015 - 2019 Red Hat, Inc.
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or any later version.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; If not, see <http://www.gnu.org/licenses/>.
+#
+# Red Hat Author(s): Anne Mulhern <amulhern@redhat.com>
+# Other Author(s): Anne Mulhern <mulhern@cs.wisc.edu>
+
+"""
+Caches bounded by the number of bytes they hold.
+"""
+
+# isort: STDLIB
+import sys
+import threading
+from collections import OrderedDict, namedtuple
+
+from ._errors import BasesValueError
+
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "entries", "bytes", "max_bytes"])
+
+
+class CachePolicies:
+    """Static class for accessing cache eviction policies."""
+
+    # pylint: disable=too-few-public-methods
+
+    LRU = "least recently used"
+    LFU = "least frequently used"
+
+    _POLICIES = [LRU, LFU]
+
+    @classmethod
+    def POLICIES(cls):  # pylint: disable=invalid-name
+        """Policies of this class."""
+        return cls._POLICIES[:]
+
+
+class Cache:
+    """
+    A map bounded by the number of bytes held by its values.
+
+    When a new value would exceed the bound, values are evicted according
+    to the policy: least recently used values first, or least frequently
+    used values first, the least recently used of those first. A value
+    which is itself larger than the bound is never cached.
+
+    The cache may be shared between threads.
+    """
+
+    # pylint: disable=too-many-instance-attributes
+
+    def __init__(self, max_bytes, policy=CachePolicies.LRU, size=sys.getsizeof):
+        """
+        Initializer.
+
+        :param int max_bytes: the bound on the bytes held, at least 0
+        :param policy: the eviction policy
+        :type policy: element of CachePolicies.POLICIES()
+        :param size: a function giving the bytes held by a value
+        :raises BasesValueError: if max_bytes or policy is invalid
+        """
+        if max_bytes < 0:
+            raise BasesValueError(max_bytes, "max_bytes", "must be at least 0")
+
+        if policy not in CachePolicies.POLICIES():
+            raise BasesValueError(
+                policy, "policy", "must be one of CachePolicies.POLICIES()"
+            )
+
+        self._lock = threading.Lock()
+        self._max_bytes = max_bytes
+        self._policy = policy
+        self._size = size
+
+        # Map from key to value, size, and number of uses.
+        self._entries = {}
+
+        # Map from number of uses to keys with that number of uses, least
+        # recently used first. Under LRU, all keys are in bucket 0.
+        self._buckets = {}
+
+        # Map from number of uses to the next lower and the next higher
+        # number of uses that have buckets, and the lowest such number, or
+        # None if there are no buckets. A key's number of uses only grows by
+        # 1, and new keys have none, so buckets are only ever added next to
+        # an existing bucket or first, and the next bucket to evict from is
+        # always known.
+        self._links = {}
+        self._least = None
+
+        self._bytes = 0
+        self._hits = 0
+        self._misses = 0
+
+    def get(self, key):
+        """
+        Get the value for key.
+
+        :param key: the key
+        :returns: the value or None if key is not cached
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+
+            self._hits += 1
+            count = entry[2]
+            if self._policy == CachePolicies.LFU:
+                entry[2] = count + 1
+                if count + 1 not in self._buckets:
+                    self._add_bucket(count + 1, count)
+                self._buckets[count + 1][key] = None
+                del self._buckets[count][key]
+                if not self._buckets[count]:
+                    self._remove_bucket(count)
+            else:
+                self._buckets[count].move_to_end(key)
+            return entry[0]
+
+    def put(self, key, value):
+        """
+        Cache value for key, evicting values if necessary.
+
+        :param key: the key
+        :param value: the value, not None
+        """
+        size = self._size(value)
+        with self._lock:
+            if size > self._max_bytes or key in self._entries:
+                return
+            self._evict(self._max_bytes - size)
+            self._entries[key] = [value, size, 0]
+            if 0 not in self._buckets:
+                self._add_bucket(0, None)
+            self._buckets[0][key] = None
+            self._bytes += size
+
+    def _add_bucket(self, count, lower):
+        """
+        Add an empty bucket, next above an existing bucket.
+
+        Must be called holding _lock.
+
+        :param int count: the number of uses of keys in the bucket
+        :param lower: the next lower bucket, None to add the bucket first
+        :type lower: int or NoneType
+        """
+        higher = self._least if lower is None else self._links[lower][1]
+        self._buckets[count] = OrderedDict()
+        self._links[count] = [lower, higher]
+        if lower is None:
+            self._least = count
+        else:
+            self._links[lower][1] = count
+        if higher is not None:
+            self._links[higher][0] = count
+
+    def _remove_bucket(self, count):
+        """
+        Remove an empty bucket.
+
+        Must be called holding _lock.
+
+        :param int count: the number of uses of keys in the bucket
+        """
+        (lower, higher) = self._links.pop(count)
+        del self._buckets[count]
+        if lower is None:
+            self._least = higher
+        else:
+            self._links[lower][1] = higher
+        if higher is not None:
+            self._links[higher][0] = lower
+
+    def _evict(self, max_bytes):
+        """
+        Evict values until at most max_bytes are held.
+
+        Must be called holding _lock.
+
+        :param int max_bytes: the number of bytes that may be held
+
+        Complexity: O(1) per value evicted
+        """
+        while self._bytes > max_bytes:
+            count = self._least
+            (key, _) = self._buckets[count].popitem(last=False)
+            if not self._buckets[count]:
+                self._remove_bucket(count)
+            self._bytes -= self._entries.pop(key)[1]
+
+    def set_max_bytes(self, max_bytes):
+        """
+        Set the bound on the bytes held.
+
+        :param int max_bytes: the bound, at least 0
+        :raises BasesValueError: if max_bytes is less than 0
+
+        Values are evicted immediately if more than the new bound is held.
+        """
+        if max_bytes < 0:
+            raise BasesValueError(max_bytes, "max_bytes", "must be at least 0")
+
+        with self._lock:
+            self._max_bytes = max_bytes
+            self._evict(max_bytes)
+
+    def clear(self):
+        """
+        Empty the cache and reset its statistics.
+        """
+        with self._lock:
+            self._entries.clear()
+            self._buckets.clear()
+            self._links.clear()
+            self._least = None
+            self._bytes = 0
+            self._hits = 0
+            self._misses = 0
+
+    def info(self):
+        """
+        Statistics about the cache.
+
+        :returns: hits, misses, number of entries, bytes held and bound
+        :rtype: CacheInfo
+        """
+        with self._lock:
+            return CacheInfo(
+                self._hits,
+                self._misses,
+                len(self._entries),
+                self._bytes,
+                self._max_bytes,
+            )
+
+
+class ResultCache:
+    """
+    An optional cache of the results of a function, disabled until it is
+    given a bound on the bytes it may hold.
+    """
+
+    def __init__(self, size=sys.getsizeof):
+        """
+        Initializer.
+
+        :param size: a function giving the bytes held by a result
+        """
+        self._cache = None
+        self._size = size
+
+    def set(self, max_bytes=0, policy=CachePolicies.LRU):
+        """
+        Set up the cache.
+
+        :param int max_bytes: the bound on the bytes held, 0 to disable
+        :param policy: the eviction policy
+        :type policy: element of CachePolicies.POLICIES()
+        :raises BasesValueError: if max_bytes or policy is invalid
+
+        Any previously cached results and statistics are discarded.
+        """
+        if max_bytes == 0:
+            self._cache = None
+        else:
+            self._cache = Cache(max_bytes, policy, self._size)
+
+    def lookup(self, key, compute, prepare=None):
+        """
+        Get the result for key, computing and caching it if necessary.
+
+        :param key: the key
+        :param compute: a function of no arguments that computes the result
+        :param prepare: a function applied to results before they are cached
+        :type prepare: function or NoneType
+        :returns: the result, which may be shared with other callers if
+           the cache is enabled
+
+        If the cache is disabled, the result of compute is returned as is.
+        """
+        cache = self._cache
+        if cache is None:
+            return compute()
+
+        result = cache.get(key)
+        if result is None:
+            result = compute()
+            if prepare is not None:
+                result = prepare(result)
+            cache.put(key, result)
+        return result
+
+    def clear(self):
+        """
+        Empty the cache and reset its statistics.
+        """
+        if self._cache is not None:
+            self._cache.clear()
+
+    def info(self):
+        """
+        Statistics about the cache.
+
+        :returns: hits, misses, number of entries, bytes held and bound
+        :rtype: CacheInfo
+        """
+        if self._cache is None:
+            return CacheInfo(0, 0, 0, 0, 0)
+        return self._cache.info()
@@ -297,7 +297,7 @@ class String:
         left = radix.integer_part
         repeating = radix.repeating_part
 
-        if repeating == []:
+        if not repeating:
             right = self.STRIP.xform(right, relation)
 
         right_str = self.DIGITS.xform(right, radix.base)
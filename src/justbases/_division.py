@@ -21,12 +21,84 @@ Long division in any bases.
 """
 
 # isort: STDLIB
-import fractions
 import itertools
+import math
 
 from ._constants import RoundingMethods
 from ._errors import BasesValueError
 from ._nats import Nats
+from ._periods import Periods
+from ._powers import Powers
+
+
+class DigitIterator:
+    """
+    An iterator over the fractional digits of remainder / divisor.
+
+    Iteration stops once every digit of the non-repeating and the repeating
+    part has been generated. The index of the first repeating digit is
+    known from the start, see cycle_start.
+    """
+
+    __slots__ = ("_base", "_cycle_start", "_divisor", "_first", "_index", "_remainder")
+
+    def __init__(self, divisor, remainder, base):
+        """
+        Initializer.
+
+        :param int divisor: the divisor, at least 1
+        :param int remainder: the remainder, less than divisor
+        :param int base: the base, at least 2
+
+        The length of the non-repeating part is found from the divisor.
+        The first remainder of the repeating part is held, so that the
+        close of the cycle is recognized when the remainder recurs.
+
+        Complexity: O(log(divisor)) gcd computations
+        """
+        (start, cofactor) = Periods.pre_period(
+            divisor // math.gcd(remainder, divisor), base
+        )
+        self._base = base
+        self._divisor = divisor
+        self._remainder = remainder
+        self._index = 0
+        self._cycle_start = None if cofactor == 1 else start
+        self._first = remainder if start == 0 and cofactor != 1 else None
+
+    @property
+    def cycle_start(self):
+        """
+        The index of the first repeating digit, None if the digits
+        terminate.
+
+        :rtype: int or NoneType
+        """
+        return self._cycle_start
+
+    def _finished(self):
+        """
+        Whether every digit has been generated.
+
+        :rtype: bool
+        """
+        if self._cycle_start is None:
+            return self._remainder == 0
+        return self._index > self._cycle_start and self._remainder == self._first
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        if self._finished():
+            # The value is also the result of ``yield from`` this iterator.
+            raise StopIteration(self._cycle_start)
+
+        (quot, self._remainder) = divmod(self._remainder * self._base, self._divisor)
+        self._index += 1
+        if self._index == self._cycle_start:
+            self._first = self._remainder
+        return quot
 
 
 class NatDivision:
@@ -34,6 +106,13 @@ class NatDivision:
     Methods for division in arbitrary bases.
     """
 
+    # More digits than this are computed in blocks of at least _BLOCK_DIGITS,
+    # each by a single division, in bases that are powers of 2 or for
+    # divisors of more than _BLOCK_DIVISOR_BITS bits.
+    _BLOCK_CUTOFF_DIGITS = 64
+    _BLOCK_DIGITS = 2**8
+    _BLOCK_DIVISOR_BITS = 128
+
     @classmethod
     def _round(
         cls, quotient, divisor, remainder, base, method=RoundingMethods.ROUND_DOWN
@@ -72,8 +151,8 @@ class NatDivision:
             (carry, quotient) = Nats.carry_in(quotient, 1, base)
             return (carry, quotient, [], 1)
 
-        remainder = fractions.Fraction(remainder, divisor)
-        middle = fractions.Fraction(base, 2)
+        # Compare remainder / divisor with base / 2 by cross-multiplication.
+        (remainder, middle) = (2 * remainder, base * divisor)
         if remainder < middle:
             return (0, quotient, [], -1)
         if remainder > middle:
@@ -90,40 +169,65 @@ class NatDivision:
             method, "method", "must be one of RoundingMethods.METHODS"
         )
 
-    @staticmethod
-    def _divide(divisor, remainder, quotient, remainders, base, precision=None):
+    @classmethod
+    def _divide(cls, divisor, remainder, quotient, base, count):
         """
-        Given a divisor and dividend, continue until precision in is reached.
+        Given a divisor and a remainder, compute ``count`` quotient digits.
 
         :param int divisor: the divisor
-        :param int remainder: the remainder
+        :param int remainder: the remainder, a multiple of base
+        :param quotient: the quotient digits computed so far
+        :type quotient: list of int
         :param int base: the base
-        :param precision: maximum number of fractional digits to compute
-        :type precision: int or NoneType
+        :param int count: the number of digits to compute
 
         :returns: the remainder
         :rtype: int
 
-        ``quotient`` and ``remainders`` are set by side effects
+        ``quotient`` is set by side effects
 
-        Complexity: O(precision) if precision is not None else O(divisor)
+        More than _BLOCK_CUTOFF_DIGITS digits are computed in blocks, by a
+        single division, by divisor, of the remainder shifted left by the
+        length of the block, if base is a power of 2 or divisor has more
+        than _BLOCK_DIVISOR_BITS bits. Blocks are at least _BLOCK_DIGITS
+        long, and longer for large divisors.
+
+        Complexity: O(count)
         """
         # pylint: disable=too-many-arguments
-
-        indices = itertools.count() if precision is None else range(precision)
-
-        for _ in indices:
-            if remainder == 0 or remainder in remainders:
-                break
-            remainders.append(remainder)
+        if count > cls._BLOCK_CUTOFF_DIGITS and (
+            base & (base - 1) == 0 or divisor.bit_length() > cls._BLOCK_DIVISOR_BITS
+        ):
+            size = max(cls._BLOCK_DIGITS, divisor.bit_length())
+            remainder //= base
+            for start in range(0, count, size):
+                length = min(size, count - start)
+                (quot, remainder) = divmod(
+                    remainder * Powers.power(base, length), divisor
+                )
+                quotient.extend(cls._digits(quot, base, length))
+            return remainder * base
+
+        for _ in range(count):
             (quot, rem) = divmod(remainder, divisor)
             quotient.append(quot)
-            if quot > 0:
-                remainder = rem * base
-            else:
-                remainder = remainder * base
+            remainder = rem * base
         return remainder
 
+    @staticmethod
+    def _digits(value, base, length):
+        """
+        Convert value to exactly ``length`` digits in base.
+
+        :param int value: the value, less than base**length
+        :param int base: the base
+        :param int length: the number of digits
+        :returns: the digits, padded with leading 0s
+        :rtype: list of int
+        """
+        digits = Nats.convert_from_int(value, base)
+        return (length - len(digits)) * [0] + digits
+
     @classmethod
     def _fractional_division(
         cls, divisor, remainder, base, precision=None, method=RoundingMethods.ROUND_DOWN
@@ -144,24 +248,37 @@ class NatDivision:
 
         :raises BasesValueError:
 
-        Complexity: O(precision) if precision is not None else O(divisor)
+        The lengths of the non-repeating and repeating parts are found from
+        the divisor, as far as they fit within precision. Then exactly the
+        necessary digits are computed.
+
+        Complexity: O(precision) if precision is not None else O(number of
+        digits in result)
         """
         # pylint: disable=too-many-arguments
         quotient = []
-        remainders = []
-        remainder = cls._divide(
-            divisor, remainder * base, quotient, remainders, base, precision
-        )
 
+        (start, cofactor) = Periods.pre_period(
+            divisor // math.gcd(remainder, divisor), base
+        )
+        if precision is None or start < precision:
+            if cofactor == 1:
+                period = 0
+            else:
+                period = Periods.order(
+                    base, cofactor, None if precision is None else precision - start
+                )
+            if period is not None:
+                cls._divide(divisor, remainder * base, quotient, base, start + period)
+                return (0, quotient[:start], quotient[start:], 0)
+
+        remainder = cls._divide(divisor, remainder * base, quotient, base, precision)
         if remainder == 0:
             return (0, quotient, [], 0)
-        if remainder in remainders:
-            start = remainders.index(remainder)
-            return (0, quotient[:start], quotient[start:], 0)
         return cls._round(quotient, divisor, remainder, base, method)
 
-    @staticmethod
-    def _division(divisor, dividend, remainder, base):
+    @classmethod
+    def _division(cls, divisor, dividend, remainder, base):
         """
         Get the quotient and remainder
 
@@ -174,8 +291,26 @@ class NatDivision:
         :returns: quotient and remainder
         :rtype: tuple of (list of int) * int
 
+        If base is a power of 2, a dividend of more than
+        _BLOCK_CUTOFF_DIGITS digits is divided in blocks, each converted to
+        an int and divided all at once. In other bases, converting the
+        blocks costs more than dividing digit by digit.
+
         Complexity: O(log_{divisor}(quotient))
         """
+        length = len(dividend)
+        if length > cls._BLOCK_CUTOFF_DIGITS and base & (base - 1) == 0:
+            size = max(cls._BLOCK_DIGITS, divisor.bit_length())
+            quotient = []
+            for start in range(0, length, size):
+                block = dividend[start : start + size]
+                value = remainder * Powers.power(base, len(block))
+                (quot, remainder) = divmod(
+                    value + Nats.convert_to_int(block, base), divisor
+                )
+                quotient.extend(cls._digits(quot, base, len(block)))
+            return (quotient, remainder)
+
         quotient = []
         for value in dividend:
             remainder = remainder * base + value
@@ -185,6 +320,34 @@ class NatDivision:
                 remainder = rem
         return (quotient, remainder)
 
+    @staticmethod
+    def _check_operands(divisor, dividend, base):
+        """
+        Check the operands of a division.
+
+        :param divisor: the divisor
+        :type divisor: sequence of int
+        :param dividend: the dividend
+        :type dividend: sequence of int
+        :param int base: the base
+        :raises BasesValueError: if the operands are invalid
+        """
+        if base < 2:
+            raise BasesValueError(base, "base", "must be at least 2")
+
+        if not Nats.valid_digits(divisor, base):
+            raise BasesValueError(
+                divisor, "divisor", "for all elements, e, 0 <= e < base required"
+            )
+
+        if not Nats.valid_digits(dividend, base):
+            raise BasesValueError(
+                dividend, "dividend", "for all elements, e, 0 <= e < base required"
+            )
+
+        if all(x == 0 for x in divisor):
+            raise BasesValueError(divisor, "divisor", "must be greater than 0")
+
     @classmethod
     def division(
         cls, divisor, dividend, base, precision=None, method=RoundingMethods.ROUND_DOWN
@@ -193,9 +356,9 @@ class NatDivision:
         Division of natural numbers.
 
         :param divisor: the divisor
-        :type divisor: list of int
+        :type divisor: sequence of int
         :param dividend: the dividend
-        :type dividend: list of int
+        :type dividend: sequence of int
         :param precision: maximum number of fractional digits
         :type precision: int or NoneType
         :param method: rounding method
@@ -212,24 +375,10 @@ class NatDivision:
         """
         # pylint: disable=too-many-arguments
 
-        if base < 2:
-            raise BasesValueError(base, "base", "must be at least 2")
-
         if precision is not None and precision < 0:
             raise BasesValueError(precision, "precision", "must be at least 0")
 
-        if any(x < 0 or x >= base for x in divisor):
-            raise BasesValueError(
-                divisor, "divisor", "for all elements, e, 0 <= e < base required"
-            )
-
-        if any(x < 0 or x >= base for x in dividend):
-            raise BasesValueError(
-                divisor, "divisor", "for all elements, e, 0 <= e < base required"
-            )
-
-        if all(x == 0 for x in divisor):
-            raise BasesValueError(divisor, "divisor", "must be greater than 0")
+        cls._check_operands(divisor, dividend, base)
 
         divisor = Nats.convert_to_int(divisor, base)
 
@@ -250,70 +399,333 @@ class NatDivision:
             relation,
         )
 
+    @classmethod
+    def division_int(
+        cls,
+        numerator,
+        denominator,
+        base,
+        precision=None,
+        method=RoundingMethods.ROUND_DOWN,
+    ):
+        """
+        Division of natural numbers given as ints.
+
+        :param int numerator: the dividend, at least 0
+        :param int denominator: the divisor, at least 1
+        :param int base: the base of the result
+        :param precision: maximum number of fractional digits
+        :type precision: int or NoneType
+        :param method: rounding method
+        :type method: element of RoundignMethods.METHODS
+        :returns: the result, as for division
+        :rtype: tuple of list of int * list of int * list of int * int
+        :raises BasesValueError: on invalid values
+
+        The operands need not be converted to base and validated digit by
+        digit, and the integer part is found by a single division.
+
+        Complexity: Uncalculated
+        """
+        # pylint: disable=too-many-arguments
+        if base < 2:
+            raise BasesValueError(base, "base", "must be at least 2")
+
+        if precision is not None and precision < 0:
+            raise BasesValueError(precision, "precision", "must be at least 0")
+
+        if numerator < 0:
+            raise BasesValueError(numerator, "numerator", "must be at least 0")
+
+        if denominator < 1:
+            raise BasesValueError(denominator, "denominator", "must be at least 1")
+
+        (integer, remainder) = divmod(numerator, denominator)
+        (
+            carry,
+            non_repeating_part,
+            repeating_part,
+            relation,
+        ) = cls._fractional_division(denominator, remainder, base, precision, method)
+
+        return (
+            Nats.convert_from_int(integer + carry, base),
+            non_repeating_part,
+            repeating_part,
+            relation,
+        )
+
+    @classmethod
+    def parallel_division(
+        cls, divisor, dividend, base, workers=None, chunk_size=2**16
+    ):
+        """
+        Division of natural numbers, with the fractional digits computed in
+        parallel by a pool of processes.
+
+        :param divisor: the divisor
+        :type divisor: sequence of int
+        :param dividend: the dividend
+        :type dividend: sequence of int
+        :param int base: the base
+        :param workers: the number of processes, or None for one per CPU
+        :type workers: int or NoneType
+        :param int chunk_size: the number of digits computed by each task
+        :returns: the result, as for division with no precision
+        :rtype: tuple of list of int * list of int * list of int * int
+        :raises BasesValueError: on invalid values
+
+        The lengths of the non-repeating and repeating parts are found from
+        the divisor. The digits are then split into segments of chunk_size
+        digits. Each segment starts from its own remainder, computed by
+        modular exponentiation, so the segments are independent.
+
+        If there is just one segment, no processes are started.
+
+        Complexity: O(number of digits in result / workers)
+        """
+        # pylint: disable=too-many-arguments
+        # pylint: disable=too-many-locals
+        if workers is not None and workers < 1:
+            raise BasesValueError(workers, "workers", "must be at least 1")
+
+        if chunk_size < 1:
+            raise BasesValueError(chunk_size, "chunk_size", "must be at least 1")
+
+        cls._check_operands(divisor, dividend, base)
+
+        divisor = Nats.convert_to_int(divisor, base)
+
+        (integer_part, remainder) = cls._division(divisor, dividend, 0, base)
+        (start, cofactor) = Periods.pre_period(
+            divisor // math.gcd(remainder, divisor), base
+        )
+        length = start + (0 if cofactor == 1 else Periods.order(base, cofactor))
+
+        indices = range(0, length, chunk_size)
+        arguments = [
+            (
+                divisor,
+                remainder * pow(base, index, divisor) % divisor * base,
+                base,
+                min(chunk_size, length - index),
+            )
+            for index in indices
+        ]
+
+        if len(arguments) <= 1:
+            segments = [cls._segment(*args) for args in arguments]
+        else:
+            # Imported here, since it loads multiprocessing, which only this
+            # rarely used method needs.
+            # isort: STDLIB
+            from concurrent.futures import (  # pylint: disable=import-outside-toplevel
+                ProcessPoolExecutor,
+            )
+
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                segments = list(executor.map(cls._segment, *zip(*arguments)))
+
+        quotient = list(itertools.chain.from_iterable(segments))
+        return (
+            list(itertools.dropwhile(lambda x: x == 0, integer_part)),
+            quotient[:start],
+            quotient[start:],
+            0,
+        )
+
+    @classmethod
+    def _segment(cls, divisor, remainder, base, count):
+        """
+        Compute ``count`` quotient digits, starting from remainder.
+
+        :param int divisor: the divisor
+        :param int remainder: the remainder, a multiple of base
+        :param int base: the base
+        :param int count: the number of digits to compute
+        :returns: the digits
+        :rtype: list of int
+        """
+        quotient = []
+        cls._divide(divisor, remainder, quotient, base, count)
+        return quotient
+
+    @classmethod
+    def iter_digits(cls, divisor, dividend, base):
+        """
+        Generate the fractional digits of a division of natural numbers.
+
+        :param divisor: the divisor
+        :type divisor: sequence of int
+        :param dividend: the dividend
+        :type dividend: sequence of int
+        :param int base: the base
+        :returns: an iterator over the fractional digits
+        :rtype: DigitIterator
+        :raises BasesValueError: on invalid values
+
+        The iterator stops when the digits terminate or when the cycle of
+        repeating digits closes, i.e., once every digit of the
+        non-repeating and the repeating part has been generated. Its
+        cycle_start property is the index of the first repeating digit, or
+        None if the digits terminate.
+
+        Digits are computed only as they are consumed.
+
+        Complexity: O(1) per digit, after O(log(divisor)) gcd computations
+        """
+        cls._check_operands(divisor, dividend, base)
+
+        divisor = Nats.convert_to_int(divisor, base)
+        remainder = Nats.convert_to_int(dividend, base) % divisor
+        return DigitIterator(divisor, remainder, base)
+
+    @classmethod
+    def fractional_digits(cls, divisor, dividend, base, index, count=1):
+        """
+        Get some fractional digits of a division of natural numbers.
+
+        :param divisor: the divisor
+        :type divisor: sequence of int
+        :param dividend: the dividend
+        :type dividend: sequence of int
+        :param int base: the base
+        :param int index: the index of the first digit, 0 for the first digit
+           after the radix point
+        :param int count: the number of digits
+        :returns: the digits at index to index + count - 1
+        :rtype: list of int
+        :raises BasesValueError: on invalid values
+
+        The remainder at index is computed directly by modular
+        exponentiation, so that no preceding digits are computed.
+
+        Complexity: O(log(index) + count)
+        """
+        # pylint: disable=too-many-arguments
+        if index < 0:
+            raise BasesValueError(index, "index", "must be at least 0")
+
+        if count < 0:
+            raise BasesValueError(count, "count", "must be at least 0")
+
+        cls._check_operands(divisor, dividend, base)
+
+        divisor = Nats.convert_to_int(divisor, base)
+        remainder = Nats.convert_to_int(dividend, base) * pow(base, index, divisor)
+
+        quotient = []
+        cls._divide(divisor, remainder % divisor * base, quotient, base, count)
+        return quotient
+
     @classmethod
     def undivision(cls, integer_part, non_repeating_part, repeating_part, base):
         """
         Find divisor and dividend that yield component parts.
 
         :param integer_part: the integer part
-        :type integer_part: list of int
+        :type integer_part: sequence of int
         :param non_repeating_part: the non_repeating_part
-        :type non_repeating_part: list of int
+        :type non_repeating_part: sequence of int
         :param repeating_part: the repeating part
-        :type repeating_part: list of int
+        :type repeating_part: sequence of int
         :param int base: the base
 
         :returns: divisor and dividend in lowest terms
         :rtype: tuple of list of int * list of int
 
+        Complexity: O(len(non_repeating_part + repeating_part + integer_part))
+        """
+        (divisor, dividend) = cls.undivision_int(
+            integer_part, non_repeating_part, repeating_part, base
+        )
+        return (
+            Nats.convert_from_int(divisor, base),
+            Nats.convert_from_int(dividend, base),
+        )
+
+    @classmethod
+    def undivision_int(cls, integer_part, non_repeating_part, repeating_part, base):
+        """
+        Find divisor and dividend, as ints, that yield component parts.
+
+        :param integer_part: the integer part
+        :type integer_part: sequence of int
+        :param non_repeating_part: the non_repeating_part
+        :type non_repeating_part: sequence of int
+        :param repeating_part: the repeating part
+        :type repeating_part: sequence of int
+        :param int base: the base
+
+        :returns: divisor and dividend in lowest terms
+        :rtype: tuple of int * int
+
         Complexity: O(len(non_repeating_part + repeating_part + integer_part))
         """
         if base < 2:
             raise BasesValueError(base, "base", "must be at least 2")
 
-        if any(x < 0 or x >= base for x in integer_part):
+        if not Nats.valid_digits(integer_part, base):
             raise BasesValueError(
                 integer_part,
                 "integer_part",
                 "for all elements, e, 0 <= e < base required",
             )
 
-        if any(x < 0 or x >= base for x in non_repeating_part):
+        if not Nats.valid_digits(non_repeating_part, base):
             raise BasesValueError(
                 non_repeating_part,
                 "non_repeating_part",
                 "for all elements, e, 0 <= e < base required",
             )
 
-        if any(x < 0 or x >= base for x in repeating_part):
+        if not Nats.valid_digits(repeating_part, base):
             raise BasesValueError(
                 repeating_part,
                 "repeating_part",
                 "for all elements, e, 0 <= e < base required",
             )
 
-        shift_length = len(repeating_part)
-        frac_length = len(non_repeating_part)
-
-        top = fractions.Fraction(
-            Nats.convert_to_int(
-                integer_part + non_repeating_part + repeating_part, base
-            ),
-            base**frac_length,
+        (divisor, dividend) = cls._undivision(
+            Nats.convert_to_int(integer_part, base),
+            Nats.convert_to_int(non_repeating_part, base),
+            len(non_repeating_part),
+            Nats.convert_to_int(repeating_part, base),
+            len(repeating_part),
+            base,
         )
+        common = math.gcd(divisor, dividend)
+        return (divisor // common, dividend // common)
+
+    @staticmethod
+    def _undivision(  # pylint: disable=too-many-arguments
+        integer, non_repeating, frac_length, repeating, shift_length, base
+    ):
+        """
+        Find divisor and dividend, not in lowest terms, from the values of
+        component parts.
+
+        :param int integer: the value of the integer part
+        :param int non_repeating: the value of the non-repeating part
+        :param int frac_length: the length of the non-repeating part
+        :param int repeating: the value of the repeating part
+        :param int shift_length: the length of the repeating part
+        :param int base: the base
+
+        :returns: divisor and dividend
+        :rtype: tuple of int * int
 
+        The value is (head + repeating / (base**shift_length - 1)) /
+        base**frac_length, where head is the value of the integer and
+        non-repeating parts together, so no gcd is required.
+
+        Complexity: O(M(n)), n the number of digits and M the complexity
+        of multiplication
+        """
+        head = integer * Powers.power(base, frac_length) + non_repeating
+        divisor = Powers.power(base, frac_length)
         if shift_length == 0:
-            return (
-                Nats.convert_from_int(top.denominator, base),
-                Nats.convert_from_int(top.numerator, base),
-            )
+            return (divisor, head)
 
-        bottom = fractions.Fraction(
-            Nats.convert_to_int(integer_part + non_repeating_part, base),
-            base**frac_length,
-        )
-        result = (top - bottom) / ((base**shift_length) - 1)
-        return (
-            Nats.convert_from_int(result.denominator, base),
-            Nats.convert_from_int(result.numerator, base),
-        )
+        period = Powers.power(base, shift_length) - 1
+        return (divisor * period, head * period + repeating)
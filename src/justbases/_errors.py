@@ -78,6 +78,12 @@ class BasesValueError(BasesError):
         return self._FMT_STR % (self._value, self._param)
 
 
+class BasesImportError(BasesError, ImportError):
+    """
+    Raised when an optional dependency is required but not installed.
+    """
+
+
 class BasesAssertError(BasesError):
     """
     For assertion failures.
@@ -20,9 +20,15 @@
 Methods dealing exclusively with natural numbers.
 """
 # isort: STDLIB
+import array
+import itertools
+import math
+import string
+from collections.abc import Sequence
 from functools import reduce  # pylint: disable=redefined-builtin
 
 from ._errors import BasesValueError
+from ._powers import Powers
 
 
 class Nats:
@@ -30,13 +36,54 @@ class Nats:
     Methods to convert non-negative ints.
     """
 
+    # Values with no more bits are always converted one digit at a time.
+    _SMALL_BITS = 32
+
+    # Values with more bits are converted to digits by divide-and-conquer.
+    _DC_CUTOFF_BITS = 2048
+
+    # Sequences with more digits are converted to ints by divide-and-conquer.
+    _DC_CUTOFF_DIGITS = 256
+
+    # Divide-and-conquer stops splitting at 2**_DC_LEAF_LEVEL digits.
+    _DC_LEAF_LEVEL = 5
+
+    # Format specs for converting ints to digits in bases 2**k, by k.
+    _FORMATS = {1: "b", 2: "x", 3: "o", 4: "x"}
+
+    # Translation tables between digit values and the characters that
+    # format() and int() use for them.
+    _DIGIT_CHARS = string.digits + string.ascii_lowercase
+    _FROM_CHARS = str.maketrans(_DIGIT_CHARS, "".join(map(chr, range(36))))
+    _TO_CHARS = bytes.maketrans(bytes(range(36)), _DIGIT_CHARS.encode("ascii"))
+
+    # Translation table from hexadecimal digits to pairs of base 4 digits.
+    _FROM_HEX_PAIRS = str.maketrans(
+        {c: chr(i >> 2) + chr(i & 3) for (i, c) in enumerate(_DIGIT_CHARS[:16])}
+    )
+
+    # Longer sequences are regrouped between bases with a common root.
+    _REGROUP_CUTOFF_DIGITS = 32
+
+    # Iterables that are not sequences are read 2**_STREAM_LEVEL digits at a
+    # time.
+    _STREAM_LEVEL = 8
+
+    # Types of buffers that may hold digits, and the formats, as used by
+    # array and memoryview, of those that hold unsigned ints.
+    _BUFFER_TYPES = (bytes, bytearray, array.array, memoryview)
+    _UNSIGNED_FORMATS = ("B", "H", "I", "L", "Q")
+
+    # Map from base to its least root and the exponent of that root.
+    _ROOTS = {}
+
     @classmethod
     def convert(cls, value, from_base, to_base):
         """
         Convert value from a base to a base.
 
         :param value: the value to convert
-        :type value: sequence of int
+        :type value: iterable of int
         :param int from_base: base of value
         :param int to_base: base of result
         :returns: the conversion result
@@ -49,17 +96,315 @@ class Nats:
           * all integers in value must be no less than 0
           * from_base, to_base must be at least 2
 
+        If from_base and to_base are powers of a common root, and not both
+        powers of 2, the digits of long values are regrouped directly,
+        without converting the value to an int.
+
+        If value is not a sequence, it is consumed in a single pass.
+
+        Complexity: O(len(value))
+        """
+        if from_base < 2:
+            raise BasesValueError(from_base, "from_base", "must be at least 2")
+
+        if to_base < 2:
+            raise BasesValueError(to_base, "to_base", "must be at least 2")
+
+        if not isinstance(value, Sequence):
+            return list(cls.iter_convert(value, from_base, to_base))
+
+        if len(value) > cls._REGROUP_CUTOFF_DIGITS:
+            (from_root, from_exp) = cls._root(from_base)
+            (to_root, to_exp) = cls._root(to_base)
+            if from_root == to_root and from_root != 2:
+                if not cls.valid_digits(value, from_base):
+                    raise BasesValueError(
+                        value,
+                        "value",
+                        f"elements must be at least 0 and less than {from_base}",
+                    )
+                return cls._regroup(value, from_root, from_exp, to_exp)
+
+        return cls._from_int(cls.convert_to_int(value, from_base), to_base)
+
+    @classmethod
+    def convert_many(cls, values, from_base, to_base):
+        """
+        Convert many values from a base to a base.
+
+        :param values: the values to convert
+        :type values: iterable of (sequence of int)
+        :param int from_base: base of values
+        :param int to_base: base of results
+        :returns: the conversion results, in the order of values
+        :rtype: list of (list of int)
+        :raises BasesValueError: if from_base is less than 2
+        :raises BasesValueError: if to_base is less than 2
+        :raises BasesValueError: if elements of any value are outside bounds
+
+        The bases are checked and the conversion method is chosen just once.
+        Each distinct value is converted just once, repeated values yield
+        equal, but distinct, lists. If any values are invalid, a single
+        error reports the indices of all of them.
+
+        Complexity: O(sum of len(v) for v in distinct values)
+        """
+        # pylint: disable=too-many-locals
+        if from_base < 2:
+            raise BasesValueError(from_base, "from_base", "must be at least 2")
+
+        if to_base < 2:
+            raise BasesValueError(to_base, "to_base", "must be at least 2")
+
+        (from_root, from_exp) = cls._root(from_base)
+        (to_root, to_exp) = cls._root(to_base)
+        regroup = from_root == to_root and from_root != 2
+        cutoff = cls._REGROUP_CUTOFF_DIGITS
+
+        def convert(value):
+            if regroup and len(value) > cutoff:
+                return cls._regroup(value, from_root, from_exp, to_exp)
+            return cls._from_int(cls._to_int(value, from_base), to_base)
+
+        (results, invalid, converted) = ([], [], {})
+        for (index, value) in enumerate(values):
+            key = tuple(value)
+            result = converted.get(key)
+            if result is None:
+                if key and (min(key) < 0 or max(key) >= from_base):
+                    invalid.append(index)
+                    continue
+                result = converted[key] = convert(key)
+                results.append(result)
+            else:
+                results.append(result[:])
+
+        if invalid:
+            raise BasesValueError(
+                invalid,
+                "values",
+                "elements of values at these indices must be at least 0 and "
+                f"less than {from_base}",
+            )
+
+        return results
+
+    @classmethod
+    def iter_convert(cls, value, from_base, to_base, length=None):
+        """
+        Convert value from a base to a base, yielding the digits of the
+        result as they become available.
+
+        :param value: the value to convert
+        :type value: iterable of int
+        :param int from_base: base of value
+        :param int to_base: base of result
+        :param length: the number of digits in value, if known
+        :type length: int or NoneType
+        :returns: the digits of the conversion result
+        :rtype: generator of int
+        :raises BasesValueError: if from_base is less than 2
+        :raises BasesValueError: if to_base is less than 2
+        :raises BasesValueError: if length is less than 0
+
+        Value is read in a single pass. If from_base and to_base are powers
+        of a common root, digits are yielded as soon as the digits of value
+        that they depend on have been read. Otherwise, no digit is yielded
+        until all of value has been read.
+
+        If a digit of value must be grouped with some following digits, as,
+        e.g., when converting from base 2 to base 8, length is required to
+        align the groups. If it is not given, value is read completely
+        before any digit is yielded.
+
+        Errors in the bases are raised immediately. Errors in value, or a
+        mismatch between length and the number of digits in value, are
+        raised by the generator when they are encountered.
+
+        Complexity: O(len(value)) if the bases are powers of a common root
+        """
+        if from_base < 2:
+            raise BasesValueError(from_base, "from_base", "must be at least 2")
+
+        if to_base < 2:
+            raise BasesValueError(to_base, "to_base", "must be at least 2")
+
+        if length is not None and length < 0:
+            raise BasesValueError(length, "length", "must be at least 0")
+
+        (from_root, from_exp) = cls._root(from_base)
+        (to_root, to_exp) = cls._root(to_base)
+        if from_root != to_root:
+            return cls._iter_via_int(value, from_base, to_base)
+
+        return cls._iter_regroup(value, from_root, from_exp, to_exp, length)
+
+    @classmethod
+    def _iter_via_int(cls, value, from_base, to_base):
+        """
+        Convert value from a base to a base by way of an int.
+
+        :param value: the value to convert
+        :type value: iterable of int
+        :param int from_base: base of value
+        :param int to_base: base of result
+        :returns: the digits of the conversion result
+        :rtype: generator of int
+        :raises BasesValueError: if elements in value outside bounds
+        """
+        yield from cls._from_int(cls._to_int_stream(value, from_base), to_base)
+
+    @classmethod
+    def _iter_regroup(  # pylint: disable=too-many-arguments
+        cls, value, root, from_exp, to_exp, length
+    ):
+        """
+        Convert value between bases that are powers of a common root,
+        yielding digits of the result as they are computed.
+
+        :param value: the value to convert
+        :type value: iterable of int
+        :param int root: the common root
+        :param int from_exp: the exponent of the base of value
+        :param int to_exp: the exponent of the base of the result
+        :param length: the number of digits in value, if known
+        :type length: int or NoneType
+        :returns: the digits of the conversion result
+        :rtype: generator of int
+        :raises BasesValueError: if elements in value outside bounds
+        :raises BasesValueError: if length does not match value
+
         Complexity: O(len(value))
         """
-        return cls.convert_from_int(cls.convert_to_int(value, from_base), to_base)
+        # pylint: disable=too-many-locals
+        group = from_exp * to_exp // math.gcd(from_exp, to_exp)
+        (from_len, to_len) = (group // from_exp, group // to_exp)
+        (from_base, to_base) = (root**from_exp, root**to_exp)
+
+        if from_len != 1 and length is None:
+            value = list(value)
+            length = len(value)
+        pad = 0 if from_len == 1 else -length % from_len
+
+        (iterator, count, leading) = (iter(value), -pad, True)
+        while True:
+            chunk = pad * [0] + list(itertools.islice(iterator, from_len - pad))
+            count += len(chunk)
+            pad = 0
+            if not cls.valid_digits(chunk, from_base):
+                raise BasesValueError(
+                    chunk,
+                    "value",
+                    f"elements must be at least 0 and less than {from_base}",
+                )
+
+            if len(chunk) < from_len:
+                break
+
+            number = reduce(lambda x, y: x * from_base + y, chunk, 0)
+            digits = cls._from_int_simple(number, to_base, to_len)
+            if leading:
+                digits = list(itertools.dropwhile(lambda x: x == 0, digits))
+                leading = not digits
+            yield from digits
+
+        if chunk != [] or (length is not None and count != length):
+            raise BasesValueError(
+                length, "length", "must be the number of digits in value"
+            )
+
+    @classmethod
+    def _root(cls, base):
+        """
+        Find the least root of which base is a power.
+
+        :param int base: the base, must be at least 2
+        :returns: the root and the exponent, root**exponent == base
+        :rtype: tuple of int * int
+
+        Complexity: O(log(base)) integer roots, computed at most once per base
+        """
+        result = cls._ROOTS.get(base)
+        if result is None:
+            result = (base, 1)
+            for exponent in range(base.bit_length(), 1, -1):
+                root = cls._integer_root(base, exponent)
+                if root**exponent == base:
+                    result = (root, exponent)
+                    break
+            cls._ROOTS[base] = result
+        return result
 
     @staticmethod
-    def convert_to_int(value, from_base):
+    def _integer_root(value, exponent):
         """
-        Convert value to an int.
+        The greatest int whose ``exponent``th power is at most ``value``.
+
+        :param int value: the value, must be at least 1
+        :param int exponent: the exponent, must be at least 1
+        :returns: the integer root
+        :rtype: int
+        """
+        root = 1 << -(-value.bit_length() // exponent)
+        while True:
+            next_root = (
+                (exponent - 1) * root + value // root ** (exponent - 1)
+            ) // exponent
+            if next_root >= root:
+                return root
+            root = next_root
+
+    @classmethod
+    def _regroup(cls, value, root, from_exp, to_exp):
+        """
+        Convert value between bases that are powers of a common root.
 
         :param value: the value to convert
         :type value: sequence of int
+        :param int root: the common root
+        :param int from_exp: the exponent of the base of value
+        :param int to_exp: the exponent of the base of the result
+        :returns: the conversion result
+        :rtype: list of int
+
+        Every run of lcm(from_exp, to_exp) // from_exp digits of value,
+        counting from the least significant digit, corresponds to exactly
+        lcm(from_exp, to_exp) // to_exp digits of the result.
+
+        Complexity: O(len(value))
+        """
+        # pylint: disable=too-many-locals
+        group = from_exp * to_exp // math.gcd(from_exp, to_exp)
+        (from_len, to_len) = (group // from_exp, group // to_exp)
+        (from_base, to_base) = (root**from_exp, root**to_exp)
+
+        value = (-len(value) % from_len) * [0] + list(value)
+        groups = value[0::from_len]
+        for offset in range(1, from_len):
+            groups = [
+                x * from_base + y for (x, y) in zip(groups, value[offset::from_len])
+            ]
+
+        columns = []
+        for _ in range(to_len - 1):
+            (groups, column) = (
+                [x // to_base for x in groups],
+                [x % to_base for x in groups],
+            )
+            columns.append(column)
+        columns.append(groups)
+        result = [x for digits in zip(*reversed(columns)) for x in digits]
+
+        start = next((i for i, x in enumerate(result) if x != 0), len(result))
+        return result[start:]
+
+    @classmethod
+    def convert_to_int(cls, value, from_base):
+        """
+        Convert value to an int.
+
+        :param value: the value to convert
+        :type value: iterable of int
         :param int from_base: base of value
         :returns: the conversion result
         :rtype: int
@@ -71,34 +416,201 @@ class Nats:
           * all integers in value must be less than from_base
           * from_base must be at least 2
 
+        Values in bases that are powers of 2 are converted by packing the
+        bits of their digits, unless they are short and the base has no
+        direct support in int(). Other values of more than _DC_CUTOFF_DIGITS
+        digits are converted by combining the conversions of their halves.
+
+        If value is not a sequence, e.g., if it is a generator, it is
+        validated and converted in a single pass.
+
         Complexity: O(len(value))
         """
         if from_base < 2:
             raise BasesValueError(from_base, "from_base", "must be greater than 2")
 
-        if any(x < 0 or x >= from_base for x in value):
+        if not isinstance(value, Sequence):
+            return cls._to_int_stream(value, from_base)
+
+        if not cls.valid_digits(value, from_base):
             raise BasesValueError(
                 value,
                 "value",
                 f"elements must be at least 0 and less than {from_base}",
             )
-        return reduce(lambda x, y: x * from_base + y, value, 0)
 
-    @staticmethod
-    def convert_from_int(value, to_base):
+        return cls._to_int(value, from_base)
+
+    @classmethod
+    def _to_int_stream(cls, value, from_base):
+        """
+        Convert value to an int in a single pass over value.
+
+        :param value: the value to convert
+        :type value: iterable of int
+        :param int from_base: base of value
+        :returns: the conversion result
+        :rtype: int
+        :raises ConvertError: if elements in value outside bounds
+
+        Digits are read in chunks of 2**_STREAM_LEVEL. Converted chunks are
+        kept on a stack and, like the digits of a binary counter, two
+        entries of the same length are merged as soon as both are present,
+        so that the result is evaluated as a balanced product tree.
+
+        Complexity: O(M(n) log(n)), n the number of digits in value and M
+        the complexity of multiplication
+        """
+        (iterator, size) = (iter(value), 2**cls._STREAM_LEVEL)
+        stack = []
+        while True:
+            chunk = list(itertools.islice(iterator, size))
+            if not cls.valid_digits(chunk, from_base):
+                raise BasesValueError(
+                    chunk,
+                    "value",
+                    f"elements must be at least 0 and less than {from_base}",
+                )
+
+            if len(chunk) < size:
+                break
+
+            (number, level) = (cls._to_int(chunk, from_base), cls._STREAM_LEVEL)
+            while stack and stack[-1][1] == level:
+                number = (
+                    stack.pop()[0] * Powers.repeated_square(from_base, level) + number
+                )
+                level += 1
+            stack.append((number, level))
+
+        result = 0
+        for (number, level) in stack:
+            result = result * Powers.repeated_square(from_base, level) + number
+        return result * Powers.power(from_base, len(chunk)) + cls._to_int(
+            chunk, from_base
+        )
+
+    @classmethod
+    def _to_int(cls, value, from_base):
+        """
+        Convert value to an int, without validating arguments.
+
+        :param value: the value to convert
+        :type value: sequence of int
+        :param int from_base: base of value
+        :returns: the conversion result
+        :rtype: int
+        """
+        if from_base & (from_base - 1) == 0:
+            bits = from_base.bit_length() - 1
+            if bits <= 5 or bits == 8 or len(value) > cls._DC_CUTOFF_DIGITS:
+                return cls._to_int_pow2(value, bits)
+        elif len(value) > cls._DC_CUTOFF_DIGITS:
+            return cls._to_int_dc(value, from_base)
+
+        result = 0
+        for digit in value:
+            result = result * from_base + digit
+        return result
+
+    @classmethod
+    def _to_int_pow2(cls, value, bits):
+        """
+        Convert value in base 2**bits to an int.
+
+        :param value: the value to convert
+        :type value: sequence of int
+        :param int bits: the number of bits in each digit
+        :returns: the conversion result
+        :rtype: int
+
+        Complexity: O(len(value))
+        """
+        if bits == 8:
+            return int.from_bytes(cls._byte_digits(value), "big")
+
+        if bits <= 5:
+            chars = bytes(cls._byte_digits(value)).translate(cls._TO_CHARS)
+            return int(chars, 2**bits) if chars else 0
+
+        fmt_str = f"0{bits}b"
+        chars = "".join(format(x, fmt_str) for x in value)
+        return int(chars, 2) if chars else 0
+
+    @classmethod
+    def _byte_digits(cls, value):
+        """
+        Get value as a buffer of bytes, one byte per digit.
+
+        :param value: the value, every element less than 256
+        :type value: sequence of int
+        :returns: value as bytes, without copying if value holds bytes
+        :rtype: bytes or memoryview
+        """
+        if isinstance(value, cls._BUFFER_TYPES):
+            view = memoryview(value)
+            return view if view.format == "B" else bytes(view.tolist())
+        return bytes(value)
+
+    @classmethod
+    def _to_int_dc(cls, value, from_base):
+        """
+        Convert value to an int by evaluating a balanced product tree.
+
+        :param value: the value to convert
+        :type value: sequence of int
+        :param int from_base: base of value
+        :returns: the conversion result
+        :rtype: int
+
+        The low part of every split has a power of 2 digits, so that the
+        powers of from_base by which the high part is shifted are those
+        shared by Powers.repeated_square.
+
+        Complexity: O(M(n) log(n)), n = len(value) and M the complexity of
+        multiplication
+        """
+        if isinstance(value, cls._BUFFER_TYPES):
+            value = memoryview(value)
+
+        length = len(value)
+        if length <= 2**cls._DC_LEAF_LEVEL:
+            return reduce(lambda x, y: x * from_base + y, value, 0)
+
+        level = (length - 1).bit_length() - 1
+        split = length - 2**level
+        return cls._to_int_dc(value[:split], from_base) * Powers.repeated_square(
+            from_base, level
+        ) + cls._to_int_dc(value[split:], from_base)
+
+    @classmethod
+    def convert_from_int(cls, value, to_base, out=None):
         """
         Convert int value to a base.
 
         :param int value: the value to convert, must be at least 0
         :param int to_base: base of result, must be at least 2
-        :returns: the conversion result
-        :rtype: list of int
+        :param out: a buffer to write the digits of the result to
+        :type out: writable buffer of unsigned ints or NoneType
+        :returns: the conversion result or, if out is given, the number of
+           digits of the result, written to the start of out
+        :rtype: list of int or int
         :raises BasesValueError: if value is less than 0
         :raises BasesValueError: if to_base is less than 2
+        :raises BasesValueError: if out can not hold the result
 
         Preconditions:
           * to_base must be at least 2
 
+        If ``to_base`` is a power of 2 the value is converted by slicing up
+        its bits, unless it is small and the base has no direct support in
+        format(). Otherwise, values of more than _DC_CUTOFF_BITS bits are
+        converted by splitting them recursively by powers of ``to_base``.
+
+        Out may be, e.g., a bytearray or an array.array of some unsigned
+        type. Its elements must be large enough to hold any digit in
+        to_base.
+
         Complexity: O(log_{to_base}(value))
         """
         if value < 0:
@@ -107,6 +619,80 @@ class Nats:
         if to_base < 2:
             raise BasesValueError(to_base, "to_base", "must be at least 2")
 
+        if out is None:
+            return cls._from_int(value, to_base)
+
+        return cls._from_int_into(value, to_base, out)
+
+    @classmethod
+    def _from_int_into(cls, value, to_base, out):
+        """
+        Convert int value to a base, writing the digits to a buffer.
+
+        :param int value: the value to convert, must be at least 0
+        :param int to_base: base of result, must be at least 2
+        :param out: a buffer to write the digits of the result to
+        :type out: writable buffer of unsigned ints
+        :returns: the number of digits written to the start of out
+        :rtype: int
+        :raises BasesValueError: if out can not hold the result
+
+        If out holds bytes and to_base is a power of 2 with direct support
+        in format(), the digits are never held in a list.
+        """
+        try:
+            view = memoryview(out)
+        except TypeError as err:
+            raise BasesValueError(out, "out", "must be a buffer") from err
+
+        if (
+            view.readonly
+            or view.ndim != 1
+            or view.format not in cls._UNSIGNED_FORMATS
+            or to_base > 2 ** (8 * view.itemsize)
+        ):
+            raise BasesValueError(
+                out,
+                "out",
+                f"must be a writable buffer of unsigned ints that can hold {to_base - 1}",
+            )
+
+        bits = to_base.bit_length() - 1
+        if (
+            view.format == "B"
+            and to_base == 2**bits
+            and (bits in cls._FORMATS or bits == 8)
+        ):
+            digits = cls._from_int_pow2_bytes(value, bits)
+        else:
+            digits = array.array(view.format, cls._from_int(value, to_base))
+
+        length = len(digits)
+        if length > len(view):
+            raise BasesValueError(out, "out", f"must hold at least {length} digits")
+
+        view[:length] = digits
+        return length
+
+    @classmethod
+    def _from_int(cls, value, to_base):
+        """
+        Convert int value to a base, without validating arguments.
+
+        :param int value: the value to convert, must be at least 0
+        :param int to_base: base of result, must be at least 2
+        :returns: the conversion result
+        :rtype: list of int
+        """
+        length = value.bit_length()
+        if length > cls._SMALL_BITS:
+            if to_base & (to_base - 1) == 0:
+                bits = to_base.bit_length() - 1
+                if bits in cls._FORMATS or bits == 8 or length > cls._DC_CUTOFF_BITS:
+                    return cls._from_int_pow2(value, bits)
+            elif length > cls._DC_CUTOFF_BITS:
+                return cls._from_int_dc(value, to_base)
+
         result = []
         while value != 0:
             (value, rem) = divmod(value, to_base)
@@ -115,12 +701,158 @@ class Nats:
         return result
 
     @staticmethod
-    def carry_in(value, carry, base):
+    def _from_int_simple(value, to_base, length=0):
+        """
+        Convert int value to a base, one digit at a time.
+
+        :param int value: the value to convert, must be at least 0
+        :param int to_base: base of result, must be at least 2
+        :param int length: minimum number of digits, padded with leading 0s
+        :returns: the conversion result
+        :rtype: list of int
+
+        Complexity: O(log_{to_base}(value)^2)
+        """
+        result = []
+        while value != 0:
+            (value, rem) = divmod(value, to_base)
+            result.append(rem)
+        result.extend((length - len(result)) * [0])
+        result.reverse()
+        return result
+
+    @classmethod
+    def _from_int_pow2(cls, value, bits):
+        """
+        Convert int value to base 2**bits.
+
+        :param int value: the value to convert, must be at least 0
+        :param int bits: the number of bits in each digit
+        :returns: the conversion result
+        :rtype: list of int
+
+        Complexity: O(log_{2}(value))
+        """
+        if bits in cls._FORMATS or bits == 8:
+            return list(cls._from_int_pow2_bytes(value, bits))
+
+        if value == 0:
+            return []
+
+        chars = format(value, "b")
+        chars = (-len(chars) % bits) * "0" + chars
+        return [int(chars[i : i + bits], 2) for i in range(0, len(chars), bits)]
+
+    @classmethod
+    def _from_int_pow2_bytes(cls, value, bits):
+        """
+        Convert int value to base 2**bits, one byte per digit.
+
+        :param int value: the value to convert, must be at least 0
+        :param int bits: the number of bits in each digit, 8 or in _FORMATS
+        :returns: the conversion result
+        :rtype: bytes
+
+        Complexity: O(log_{2}(value))
+        """
+        if value == 0:
+            return b""
+
+        if bits == 8:
+            return value.to_bytes((value.bit_length() + 7) // 8, "big")
+
+        if bits == 2:
+            result = format(value, "x").translate(cls._FROM_HEX_PAIRS)
+            result = result.encode("latin-1")
+            return result[1:] if result[0] == 0 else result
+
+        return (
+            format(value, cls._FORMATS[bits])
+            .translate(cls._FROM_CHARS)
+            .encode("latin-1")
+        )
+
+    @classmethod
+    def _from_int_dc(cls, value, to_base):
+        """
+        Convert int value to a base by divide-and-conquer.
+
+        :param int value: the value to convert, must be at least 0
+        :param int to_base: base of result, must be at least 2
+        :returns: the conversion result
+        :rtype: list of int
+
+        Complexity: O(M(n) log(n)), n the number of digits in the result and
+        M the complexity of multiplication
+        """
+        level = 0
+        while Powers.repeated_square(to_base, level) <= value:
+            level += 1
+        result = []
+        cls._from_int_dc_digits(value, to_base, level, False, result)
+        return result
+
+    @classmethod
+    def _from_int_dc_digits(  # pylint: disable=too-many-arguments
+        cls, value, to_base, level, pad, result
+    ):
+        """
+        Append the digits of value to result.
+
+        :param int value: the value, less than to_base**(2**level)
+        :param int to_base: base of result, must be at least 2
+        :param int level: the level of the split
+        :param bool pad: if True, append exactly 2**level digits
+        :param result: the digits computed so far
+        :type result: list of int
+        """
+        if level <= cls._DC_LEAF_LEVEL:
+            result.extend(
+                cls._from_int_simple(value, to_base, 2**level if pad else 0)
+            )
+            return
+
+        power = Powers.repeated_square(to_base, level - 1)
+        if not pad and value < power:
+            cls._from_int_dc_digits(value, to_base, level - 1, False, result)
+            return
+
+        (high, low) = divmod(value, power)
+        cls._from_int_dc_digits(high, to_base, level - 1, pad, result)
+        cls._from_int_dc_digits(low, to_base, level - 1, True, result)
+
+    @staticmethod
+    def valid_digits(value, base):
+        """
+        Whether every element of value is a digit in base.
+
+        :param value: the value
+        :type value: sequence of int
+        :param int base: the base
+        :returns: True if every element is at least 0 and less than base
+        :rtype: bool
+
+        Buffers of unsigned ints, like bytes, are checked just against
+        their greatest element.
+
+        Complexity: O(len(value))
+        """
+        if len(value) == 0:
+            return True
+        if (
+            isinstance(value, Nats._BUFFER_TYPES)
+            and memoryview(value).format in Nats._UNSIGNED_FORMATS
+        ):
+            return max(value) < base
+        return min(value) >= 0 and max(value) < base
+
+    @classmethod
+    def carry_in(cls, value, carry, base):
         """
         Add a carry digit to a number represented by ``value``.
 
         :param value: the value
-        :type value: list of int
+        :type value: sequence of int
         :param int carry: the carry digit (>= 0)
         :param int base: the base (>= 2)
 
@@ -132,7 +864,7 @@ class Nats:
         if base < 2:
             raise BasesValueError(base, "base", "must be at least 2")
 
-        if any(x < 0 or x >= base for x in value):
+        if not cls.valid_digits(value, base):
             raise BasesValueError(
                 value, "value", "elements must be at least 0 and less than {base}"
             )
@@ -0,0 +1,404 @@
+# Copyright (C) 2015 - 2019 Red Hat, Inc.
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or any later version.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; If not, see <http://www.gnu.org/licenses/>.
+#
+# Red Hat Author(s): Anne Mulhern <amulhern@redhat.com>
+# Other Author(s): Anne Mulhern <mulhern@cs.wisc.edu>
+
+"""
+Lengths of the non-repeating and repeating parts of fractions.
+"""
+
+# isort: STDLIB
+import array
+import math
+import sys
+from collections import Counter
+
+from ._cache import Cache
+
+
+class Periods:
+    """
+    Methods to find where the digits of a fraction start to repeat, and
+    how often, without computing the digits.
+
+    Factorizations and orders are cached, since fractions with the same
+    denominator share them. The caches are bounded by the number of bytes
+    held, and the least recently used values are evicted first. Small
+    values may also be factored by a sieve, see sieve().
+    """
+
+    # Primes found by trial division, before resorting to Pollard's rho.
+    _SMALL_PRIMES = [
+        p
+        for p in range(2, 1000)
+        if all(p % d != 0 for d in range(2, math.isqrt(p) + 1))
+    ]
+
+    # Bases for the Miller-Rabin test, which is deterministic for values less
+    # than 3.3 * 10**24 when using the first 13 of these.
+    _WITNESSES = _SMALL_PRIMES[:20]
+
+    # The number of steps Pollard's rho may take, with each polynomial, before
+    # giving up, and the number of steps between gcd computations.
+    _RHO_STEPS = 2**16
+    _RHO_BATCH = 2**7
+
+    # The number of powers computed in the search for an order before the
+    # modulus is factored.
+    _ORDER_SEARCH_STEPS = 2**16
+
+    # The default bound on the bytes held by each cache.
+    _DEFAULT_MAX_BYTES = 2**24
+
+    # Map from value to its factorization, as a dict.
+    _FACTORS = Cache(
+        _DEFAULT_MAX_BYTES,
+        size=lambda factors: sys.getsizeof(factors)
+        + sum(sys.getsizeof(prime) for prime in factors),
+    )
+
+    # Map from (base % modulus, modulus) to the order of base modulo modulus.
+    _ORDERS = Cache(_DEFAULT_MAX_BYTES)
+
+    # The least prime factor of every value less than its length, 0 for
+    # values less than 2.
+    _SIEVE = array.array("I")
+
+    @staticmethod
+    def pre_period(denominator, base):
+        """
+        The length of the non-repeating part of a fraction in lowest terms.
+
+        :param int denominator: the denominator, must be at least 1
+        :param int base: the base, must be at least 2
+        :returns: the length and the factor of denominator coprime to base
+        :rtype: tuple of int * int
+
+        The length is the least k such that denominator divides
+        cofactor * base**k.
+
+        Complexity: O(log(denominator)) gcd computations
+        """
+        length = 0
+        common = math.gcd(denominator, base)
+        while common != 1:
+            denominator //= common
+            length += 1
+            common = math.gcd(denominator, base)
+        return (length, denominator)
+
+    @classmethod
+    def order(cls, base, modulus, limit=None):
+        """
+        The multiplicative order of base modulo modulus, i.e., the length of
+        the repeating part of a fraction with denominator modulus.
+
+        :param int base: the base, coprime to modulus
+        :param int modulus: the modulus, must be at least 2
+        :param limit: the greatest order of interest
+        :type limit: int or NoneType
+        :returns: the least k > 0 such that base**k % modulus == 1
+        :rtype: int or NoneType
+
+        Returns None if the order is greater than limit.
+
+        Short orders are found directly. Otherwise, the order is found
+        among the divisors of the Carmichael function of modulus. If
+        modulus can not be factored, the search for the order resumes.
+
+        Complexity: O(1) if cached, otherwise O(min(order, limit))
+        multiplications if modulus can not be factored
+        """
+        base %= modulus
+        key = (base, modulus)
+        result = cls._ORDERS.get(key)
+        if result is None:
+            result = cls._order(base, modulus, limit)
+            if result is None:
+                return None
+            cls._ORDERS.put(key, result)
+        return result if limit is None or result <= limit else None
+
+    @classmethod
+    def _order(cls, base, modulus, limit):
+        """
+        Find the multiplicative order of base modulo modulus.
+
+        :param int base: the base, coprime to and less than modulus
+        :param int modulus: the modulus, must be at least 2
+        :param limit: the greatest order of interest
+        :type limit: int or NoneType
+        :returns: the order, or None if it is not found within limit steps
+        :rtype: int or NoneType
+
+        The order may be greater than limit if modulus can be factored.
+        If the exponent found from the factors is not a multiple of the
+        order, the search resumes.
+        """
+        steps = cls._ORDER_SEARCH_STEPS
+        if limit is not None:
+            steps = min(limit, steps)
+
+        power = base
+        for length in range(1, steps + 1):
+            if power == 1:
+                return length
+            power = power * base % modulus
+
+        if steps != cls._ORDER_SEARCH_STEPS:
+            return None
+
+        factors = cls.factor(modulus)
+        if factors is not None:
+            factors = cls._carmichael(factors)
+        if factors is not None:
+            exponent = math.prod(p**k for (p, k) in factors.items())
+            # A pseudoprime taken for a prime factor gives a wrong exponent.
+            if pow(base, exponent, modulus) == 1:
+                for prime in factors:
+                    while (
+                        exponent % prime == 0
+                        and pow(base, exponent // prime, modulus) == 1
+                    ):
+                        exponent //= prime
+                return exponent
+
+        length = cls._ORDER_SEARCH_STEPS + 1
+        while power != 1:
+            if limit is not None and length >= limit:
+                return None
+            power = power * base % modulus
+            length += 1
+        return length
+
+    @classmethod
+    def _carmichael(cls, factors):
+        """
+        Factor the Carmichael function of a number, given its factorization.
+
+        :param factors: map from prime factors to their multiplicities
+        :type factors: dict of int * int
+        :returns: the factors of the least k such that a**k % n == 1 for all
+           a coprime to n
+        :rtype: Counter or NoneType
+
+        Returns None if some p - 1 can not be factored.
+        """
+        result = Counter()
+        for (prime, multiplicity) in factors.items():
+            if prime == 2:
+                value = Counter(
+                    {2: multiplicity - 2 if multiplicity > 2 else multiplicity - 1}
+                )
+            else:
+                value = cls.factor(prime - 1)
+                if value is None:
+                    return None
+                value[prime] += multiplicity - 1
+            result |= value
+        return result
+
+    @classmethod
+    def factor(cls, value):
+        """
+        Factor value by trial division and Pollard's rho.
+
+        :param int value: the value, must be at least 1
+        :returns: map from prime factors to their multiplicities
+        :rtype: Counter or NoneType
+
+        Returns None if value has factors too large to be found within
+        _RHO_STEPS steps.
+
+        Complexity: O(log(value)) if value is within the sieve or cached
+        """
+        if value < len(cls._SIEVE):
+            factors = Counter()
+            while value > 1:
+                prime = cls._SIEVE[value] or value
+                factors[prime] += 1
+                value //= prime
+            return factors
+
+        factors = cls._FACTORS.get(value)
+        if factors is None:
+            factors = cls._factor(value)
+            if factors is None:
+                return None
+            cls._FACTORS.put(value, dict(factors))
+        return Counter(factors)
+
+    @classmethod
+    def _factor(cls, value):
+        """
+        Factor value by trial division and Pollard's rho.
+
+        :param int value: the value, must be at least 1
+        :returns: map from prime factors to their multiplicities
+        :rtype: Counter or NoneType
+        """
+        factors = Counter()
+        for prime in cls._SMALL_PRIMES:
+            if prime * prime > value:
+                break
+            while value % prime == 0:
+                factors[prime] += 1
+                value //= prime
+
+        # Remaining composites have no factor less than the largest small prime.
+        limit = cls._SMALL_PRIMES[-1] ** 2
+        stack = [value] if value > 1 else []
+        while stack:
+            value = stack.pop()
+            if value < limit or cls._is_prime(value):
+                factors[value] += 1
+                continue
+            divisor = cls._pollard_rho(value)
+            if divisor is None:
+                return None
+            stack.extend((divisor, value // divisor))
+        return factors
+
+    @classmethod
+    def sieve(cls, limit=0):
+        """
+        Set up a sieve which factors every value less than limit.
+
+        :param int limit: the bound on values factored, 0 to discard the sieve
+
+        Complexity: O(limit * log(log(limit)))
+        """
+        limit = max(limit, 0)
+        root = math.isqrt(max(limit - 1, 0))
+
+        # Only primes up to the square root of limit are needed, and only
+        # primes are sieved with, so that each value is marked once for
+        # each of its prime factors.
+        composite = bytearray(root + 1)
+        primes = []
+        for prime in range(2, root + 1):
+            if not composite[prime]:
+                primes.append(prime)
+                composite[prime * prime :: prime] = b"\x01" * len(
+                    range(prime * prime, root + 1, prime)
+                )
+
+        # Smaller primes are written last, so that each value is left with
+        # its least prime factor.
+        result = array.array("I", [0]) * limit
+        for prime in reversed(primes):
+            start = prime * prime
+            result[start::prime] = array.array("I", [prime]) * len(
+                range(start, limit, prime)
+            )
+        cls._SIEVE = result
+
+    @classmethod
+    def set_max_bytes(cls, max_bytes=None):
+        """
+        Set the bound on the bytes held by each cache.
+
+        :param max_bytes: the bound, or None for the default
+        :type max_bytes: int or NoneType
+        :raises BasesValueError: if max_bytes is less than 0
+
+        A bound of 0 disables the caches.
+        """
+        if max_bytes is None:
+            max_bytes = cls._DEFAULT_MAX_BYTES
+
+        cls._FACTORS.set_max_bytes(max_bytes)
+        cls._ORDERS.set_max_bytes(max_bytes)
+
+    @classmethod
+    def clear(cls):
+        """
+        Empty the caches and reset their statistics.
+        """
+        cls._FACTORS.clear()
+        cls._ORDERS.clear()
+
+    @classmethod
+    def info(cls):
+        """
+        Statistics about the caches.
+
+        :returns: statistics about factorizations and about orders
+        :rtype: tuple of CacheInfo * CacheInfo
+        """
+        return (cls._FACTORS.info(), cls._ORDERS.info())
+
+    @classmethod
+    def _is_prime(cls, value):
+        """
+        Whether value is prime, by the Miller-Rabin test.
+
+        :param int value: the value, odd and at least 3
+        :rtype: bool
+        """
+        (odd, twos) = (value - 1, 0)
+        while odd % 2 == 0:
+            (odd, twos) = (odd // 2, twos + 1)
+
+        for witness in cls._WITNESSES:
+            power = pow(witness, odd, value)
+            if power in (1, value - 1):
+                continue
+            for _ in range(twos - 1):
+                power = power * power % value
+                if power == value - 1:
+                    break
+            else:
+                return False
+        return True
+
+    @classmethod
+    def _pollard_rho(cls, value):
+        """
+        Find a non-trivial divisor of a composite value by Pollard's rho.
+
+        :param int value: the value, composite and odd
+        :returns: a divisor or None if none found within _RHO_STEPS steps
+        :rtype: int or NoneType
+        """
+        for increment in (1, 2):
+            (tortoise, hare, divisor) = (2, 2, 1)
+            for _ in range(0, cls._RHO_STEPS, cls._RHO_BATCH):
+                (saved, product) = ((tortoise, hare), 1)
+                for _ in range(cls._RHO_BATCH):
+                    tortoise = (tortoise * tortoise + increment) % value
+                    hare = (hare * hare + increment) % value
+                    hare = (hare * hare + increment) % value
+                    product = product * (tortoise - hare) % value
+                divisor = math.gcd(product, value)
+                if divisor != 1:
+                    break
+
+            # All factors were found in the same batch, so repeat it, a step
+            # at a time.
+            if divisor == value:
+                (tortoise, hare) = saved
+                for _ in range(cls._RHO_BATCH):
+                    tortoise = (tortoise * tortoise + increment) % value
+                    hare = (hare * hare + increment) % value
+                    hare = (hare * hare + increment) % value
+                    divisor = math.gcd(tortoise - hare, value)
+                    if divisor != 1:
+                        break
+
+            if divisor not in (1, value):
+                return divisor
+        return None
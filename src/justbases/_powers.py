@@ -0,0 +1,126 @@
+# Copyright (C) 2015 - 2019 Red Hat, Inc.
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or any later version.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; If not, see <http://www.gnu.org/licenses/>.
+#
+# Red Hat Author(s): Anne Mulhern <amulhern@redhat.com>
+# Other Author(s): Anne Mulhern <mulhern@cs.wisc.edu>
+
+"""
+A cache of powers of bases, shared by all conversions.
+"""
+
+# isort: STDLIB
+from collections import namedtuple
+
+from ._cache import Cache
+
+PowersInfo = namedtuple(
+    "PowersInfo", ["hits", "misses", "entries", "bytes", "max_bytes"]
+)
+
+
+class Powers:
+    """
+    Methods to get powers of bases, which are cached.
+
+    The cache is bounded by the number of bytes held by the cached values.
+    When a new value would exceed the bound, the least recently used values
+    are evicted. A value which is itself larger than the bound is never
+    cached.
+    """
+
+    # The default bound on the bytes held by the cache.
+    _DEFAULT_MAX_BYTES = 2**26
+
+    # Map from (base, exponent) to base**exponent.
+    _CACHE = Cache(_DEFAULT_MAX_BYTES)
+
+    @classmethod
+    def power(cls, base, exponent):
+        """
+        Get base**exponent, computing and caching it if necessary.
+
+        :param int base: the base
+        :param int exponent: the exponent, must be at least 0
+        :returns: base**exponent
+        :rtype: int
+
+        Complexity: O(1) if cached
+        """
+        key = (base, exponent)
+        result = cls._CACHE.get(key)
+        if result is None:
+            result = base**exponent
+            cls._CACHE.put(key, result)
+        return result
+
+    @classmethod
+    def repeated_square(cls, base, level):
+        """
+        Get base**(2**level), computing and caching it if necessary.
+
+        :param int base: the base
+        :param int level: the level, must be at least 0
+        :returns: base**(2**level)
+        :rtype: int
+
+        The result is computed by squaring base**(2**(level - 1)), which is
+        itself looked up in the cache.
+
+        Complexity: O(1) if cached
+        """
+        if level == 0:
+            return base
+
+        key = (base, 1 << level)
+        result = cls._CACHE.get(key)
+        if result is None:
+            result = cls.repeated_square(base, level - 1)
+            result *= result
+            cls._CACHE.put(key, result)
+        return result
+
+    @classmethod
+    def set_max_bytes(cls, max_bytes=None):
+        """
+        Set the bound on the bytes held by the cache.
+
+        :param max_bytes: the bound, or None for the default
+        :type max_bytes: int or NoneType
+        :raises BasesValueError: if max_bytes is less than 0
+
+        Values are evicted immediately if the cache holds more than the new
+        bound. A bound of 0 disables the cache.
+        """
+        if max_bytes is None:
+            max_bytes = cls._DEFAULT_MAX_BYTES
+
+        cls._CACHE.set_max_bytes(max_bytes)
+
+    @classmethod
+    def clear(cls):
+        """
+        Empty the cache and reset its statistics.
+        """
+        cls._CACHE.clear()
+
+    @classmethod
+    def info(cls):
+        """
+        Statistics about the cache.
+
+        :returns: hits, misses, number of entries, bytes held and bound
+        :rtype: PowersInfo
+        """
+        return PowersInfo(*cls._CACHE.info())
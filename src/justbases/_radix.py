@@ -0,0 +1,563 @@
+# Copyright (C) 2015 - 2019 Red Hat, Inc.
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or any later version.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; If not, see <http://www.gnu.org/licenses/>.
+#
+# Red Hat Author(s): Anne Mulhern <amulhern@redhat.com>
+# Other author(s): Anne Mulhern <mulhern@cs.wisc.edu>
+
+"""
+Representation of rational numbers as strings of digits.
+"""
+
+# isort: STDLIB
+import copy
+from fractions import Fraction
+
+from ._config import BasesConfig
+from ._display import String
+from ._division import NatDivision
+from ._errors import BasesInvalidOperationError, BasesValueError
+from ._nats import Nats
+from ._rounding import Rounding
+
+
+class Radix:
+    """
+    An object containing information about a rational representation.
+
+    Such values can not be ordered, but can be compared for equality.
+
+    See FrozenRadix for an immutable, hashable variant.
+    """
+
+    # pylint: disable=too-few-public-methods
+
+    __slots__ = ("sign", "base", "integer_part", "non_repeating_part", "repeating_part")
+
+    _FMT_STR = "".join(
+        [
+            "%(sign)s",
+            "%(left)s",
+            "%(radix)s",
+            "%(non_repeat)s",
+            "%(repeat)s",
+            "_",
+            "%(base)s",
+        ]
+    )
+
+    @classmethod
+    def _validate(  # pylint: disable=too-many-arguments
+        cls, sign, integer_part, non_repeating_part, repeating_part, base
+    ):
+        """
+        Check if radix is valid.
+
+        :param int sign: -1, 0, or 1 as appropriate
+        :param integer_part: the part on the left side of the radix
+        :type integer_part: list of int
+        :param non_repeating_part: non repeating part on left side
+        :type non_repeating_part: list of int
+        :param repeating_part: repeating part
+        :type repeating_part: list of int
+        :param int base: base of the radix, must be at least 2
+
+        :returns: BasesValueError if invalid values
+        :rtype: BasesValueError or NoneType
+
+        Complexity: O(len(integer_part + non_repeating_part + repeating_part))
+        """
+        if not Nats.valid_digits(integer_part, base):
+            return BasesValueError(
+                integer_part, "integer_part", "values must be between 0 and {base}"
+            )
+        if not Nats.valid_digits(non_repeating_part, base):
+            return BasesValueError(
+                non_repeating_part,
+                "non_repeating_part",
+                "values must be between 0 and {base}",
+            )
+        if not Nats.valid_digits(repeating_part, base):
+            return BasesValueError(
+                repeating_part,
+                "repeating_part",
+                "values must be between 0 and {base}",
+            )
+        if base < 2:
+            return BasesValueError(base, "base", "must be at least 2")
+
+        if sign not in (-1, 0, 1) or sign is True or sign is False:
+            return BasesValueError(sign, "sign", "must be an int between -1 and 1")
+
+        return None
+
+    @staticmethod
+    def _repeat_length(part):
+        """
+        The length of the repeated portions of ``part``.
+
+        :param part: a number
+        :type part: list of int
+        :returns: the first index at which part repeats
+        :rtype: int
+
+        If part does not repeat, result is the length of part.
+
+        The length of the longest proper prefix of part that is also a
+        suffix is found with the prefix function of the Knuth-Morris-Pratt
+        algorithm. Part repeats if and only if the remaining length
+        divides the length of part.
+
+        Complexity: O(len(part))
+        """
+        repeat_len = len(part)
+        if repeat_len == 0:
+            return repeat_len
+
+        prefix = [0] * repeat_len
+        for index in range(1, repeat_len):
+            length = prefix[index - 1]
+            while length > 0 and part[index] != part[length]:
+                length = prefix[length - 1]
+            if part[index] == part[length]:
+                length += 1
+            prefix[index] = length
+
+        period = repeat_len - prefix[-1]
+        return period if repeat_len % period == 0 else repeat_len
+
+    @classmethod
+    def _canonicalize_fraction(cls, non_repeating, repeating):
+        """
+        If the same fractional value can be represented by stripping repeating
+        part from ``non_repeating``, do it.
+
+        :param non_repeating: non repeating part of fraction
+        :type non_repeating: list of int
+        :param repeating: repeating part of fraction
+        :type repeating: list of int
+        :returns: new non_repeating and repeating parts
+        :rtype: tuple of list of int * list of int
+
+        The last digit of non_repeating may be moved into the repeating
+        part if it equals the last digit of the repeating part, which is
+        then rotated right by one. The digits of non_repeating are
+        compared, from last to first, with the digits of the repeating
+        part, cycled backwards, until they differ.
+
+        * for [6, 1, 2, 1, 2], [1, 2] result is [6], [1, 2]
+        * for [6, 2, 1, 2], [1, 2] result is [6], [2, 1]
+
+        Complexity: O(len(non_repeating + repeating))
+        """
+        if not repeating:
+            return (non_repeating, repeating)
+
+        repeat_len = len(repeating)
+        end = len(non_repeating)
+        index = -1
+        while end > 0 and non_repeating[end - 1] == repeating[index]:
+            end -= 1
+            index = index - 1 if index > -repeat_len else -1
+
+        shift = (len(non_repeating) - end) % repeat_len
+        if shift == 0:
+            return (non_repeating[:end], repeating)
+        return (
+            non_repeating[:end],
+            cls._concatenate(repeating[-shift:], repeating[:-shift]),
+        )
+
+    @staticmethod
+    def _concatenate(first, second):
+        """
+        Concatenate two sequences of digits.
+
+        :param first: the first sequence
+        :type first: sequence of int
+        :param second: the second sequence
+        :type second: sequence of int
+        :returns: the concatenation, of the type of the arguments if possible
+        :rtype: sequence of int
+
+        Complexity: O(len(first + second))
+        """
+        try:
+            return first + second
+        except TypeError:
+            return list(first) + list(second)
+
+    @staticmethod
+    def _equal_digits(first, second):
+        """
+        Whether two sequences of digits hold the same digits.
+
+        :param first: the first sequence
+        :type first: sequence of int
+        :param second: the second sequence
+        :type second: sequence of int
+        :rtype: bool
+
+        Complexity: O(len(first))
+        """
+        if type(first) is type(second):  # pylint: disable=unidiomatic-typecheck
+            return first == second
+        return len(first) == len(second) and all(
+            x == y for (x, y) in zip(first, second)
+        )
+
+    @staticmethod
+    def _copy_digits(value):
+        """
+        Copy a sequence of digits.
+
+        :param value: the sequence
+        :type value: sequence of int
+        :returns: a copy of value, of the same type
+        :rtype: sequence of int
+
+        Complexity: O(len(value))
+        """
+        if isinstance(value, memoryview):
+            return memoryview(value.tobytes()).cast(value.format)
+        return value[:]
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        sign,
+        integer_part,
+        non_repeating_part,
+        repeating_part,
+        base,
+        validate=True,
+        canonicalize=True,
+    ):
+        """
+        Initializer.
+
+        :param int sign: -1, 0, or 1 as appropriate
+        :param integer_part: the part on the left side of the radix
+        :type integer_part: list of int
+        :param non_repeating_part: non repeating part on left side
+        :type non_repeating_part: list of int
+        :param repeating_part: repeating part
+        :type repeating_part: list of int
+        :param int base: base of the radix, must be at least 2
+        :param bool validate: if True, validate the arguments
+        :param bool canonicalize: if True, canonicalize
+
+        Validation and canonicalization are expensive and may be omitted.
+
+        Complexity: linear in number of digits if canonicalize or validate
+        is True, otherwise constant time
+        """
+        if validate:
+            error = self._validate(
+                sign, integer_part, non_repeating_part, repeating_part, base
+            )
+            if error is not None:
+                raise error  # pylint: disable=raising-bad-type
+
+        if canonicalize:
+            if all(x == 0 for x in integer_part):
+                integer_part = integer_part[0:0]
+
+            repeating_part = repeating_part[0 : self._repeat_length(repeating_part)]
+            (non_repeating_part, repeating_part) = self._canonicalize_fraction(
+                non_repeating_part, repeating_part
+            )
+            if all(x == 0 for x in repeating_part):
+                repeating_part = repeating_part[0:0]
+
+            if len(repeating_part) == 1 and repeating_part[0] == base - 1:
+                repeating_part = repeating_part[0:0]
+                (carry_out, non_repeating_part) = Nats.carry_in(
+                    non_repeating_part, 1, base
+                )
+                if carry_out != 0:
+                    (carry_out, integer_part) = Nats.carry_in(integer_part, 1, base)
+                    if carry_out != 0:
+                        integer_part = [carry_out] + integer_part
+
+            if (
+                not integer_part
+                and not repeating_part
+                and all(x == 0 for x in non_repeating_part)
+            ):
+                sign = 0
+
+        self._initialize(sign, base, integer_part, non_repeating_part, repeating_part)
+
+    def _initialize(  # pylint: disable=too-many-arguments
+        self, sign, base, integer_part, non_repeating_part, repeating_part
+    ):
+        """
+        Set the attributes of this value.
+
+        :param int sign: -1, 0, or 1 as appropriate
+        :param int base: base of the radix
+        :param integer_part: the part on the left side of the radix
+        :type integer_part: sequence of int
+        :param non_repeating_part: non repeating part on left side
+        :type non_repeating_part: sequence of int
+        :param repeating_part: repeating part
+        :type repeating_part: sequence of int
+        """
+        self.sign = sign
+        self.base = base
+        self.integer_part = integer_part
+        self.non_repeating_part = non_repeating_part
+        self.repeating_part = repeating_part
+
+    def getString(self, config, relation=0):  # pylint: disable=invalid-name
+        """
+        Return a representation of a Radix according to config.
+
+        :param DisplayConfig config: configuration
+        :param int relation: the relation of this value to actual value
+        """
+        return String(config, self.base).xform(self, relation)
+
+    def __str__(self):
+        return self.getString(BasesConfig.DISPLAY_CONFIG, 0)
+
+    def __repr__(self):
+        return (
+            f"{type(self).__name__}({self.sign},{self.integer_part},"
+            f"{self.non_repeating_part},{self.repeating_part},{self.base})"
+        )
+
+    def __eq__(self, other):
+        if not isinstance(other, Radix):
+            raise BasesInvalidOperationError("!=", other)
+        return (
+            self.sign == other.sign
+            and self._equal_digits(self.integer_part, other.integer_part)
+            and self._equal_digits(self.non_repeating_part, other.non_repeating_part)
+            and self._equal_digits(self.repeating_part, other.repeating_part)
+            and self.base == other.base
+        )
+
+    def __ne__(self, other):
+        if not isinstance(other, Radix):
+            raise BasesInvalidOperationError("!=", other)
+        return not self == other
+
+    def __lt__(self, other):
+        raise BasesInvalidOperationError("<")
+
+    def __gt__(self, other):
+        raise BasesInvalidOperationError(">")
+
+    def __le__(self, other):
+        raise BasesInvalidOperationError("<=")
+
+    def __ge__(self, other):
+        raise BasesInvalidOperationError(">=")
+
+    def __getstate__(self):
+        return (
+            self.sign,
+            self.base,
+            self.integer_part,
+            self.non_repeating_part,
+            self.repeating_part,
+        )
+
+    def __setstate__(self, state):
+        self._initialize(*state)
+
+    def __copy__(self):  # pragma: no cover
+        return Radix(
+            self.sign,
+            self.integer_part,
+            self.non_repeating_part,
+            self.repeating_part,
+            self.base,
+        )
+
+    def __deepcopy__(self, memo):
+        return Radix(
+            self.sign,
+            self._copy_digits(self.integer_part),
+            self._copy_digits(self.non_repeating_part),
+            self._copy_digits(self.repeating_part),
+            self.base,
+        )
+
+    def frozen(self):
+        """
+        Return this value as a FrozenRadix.
+
+        :returns: an immutable copy of this value
+        :rtype: FrozenRadix
+
+        Complexity: O(number of digits)
+        """
+        return FrozenRadix(
+            self.sign,
+            self.integer_part,
+            self.non_repeating_part,
+            self.repeating_part,
+            self.base,
+            False,
+            False,
+        )
+
+    def as_rational(self):
+        """
+        Return this value as a Rational.
+
+        :returns: this radix as a rational
+        :rtype: Rational
+        """
+        # pylint: disable=protected-access
+        (divisor, dividend) = NatDivision._undivision(
+            Nats.convert_to_int(self.integer_part, self.base),
+            Nats.convert_to_int(self.non_repeating_part, self.base),
+            len(self.non_repeating_part),
+            Nats.convert_to_int(self.repeating_part, self.base),
+            len(self.repeating_part),
+            self.base,
+        )
+        return Fraction(self.sign * dividend, divisor)
+
+    def as_int(self, method):
+        """
+        This value as an int, rounded according to ``method``.
+
+        :param method: rounding method
+        :raises BasesValueError: on bad parameters
+
+        :returns: corresponding int value
+        :rtype: int
+        """
+        (new_radix, relation) = self.rounded(0, method)
+        value = Nats.convert_to_int(new_radix.integer_part, new_radix.base)
+        return (value * self.sign, relation)
+
+    def rounded(self, precision, method):
+        """
+        This value with fractional part rounded to ``precision`` digits
+        according to ``method``.
+
+        :param int precision: number of digits in total
+        :param method: rounding method
+        :raises BasesValueError: on bad parameters
+
+        Precondition: Radix is valid and canonical
+
+        Complexity: O(len(components))
+        """
+        return Rounding.roundFractional(self, precision, method)
+
+    def in_base(self, base):
+        """
+        Return value in ``base``.
+
+        :returns: Radix in ``base``
+        :rtype: Radix
+        :raises ConvertError: if ``base`` is less than 2
+        """
+        if base == self.base:
+            return copy.deepcopy(self)
+        value = self.as_rational()
+        (
+            integer_part,
+            non_repeating_part,
+            repeating_part,
+            _,
+        ) = NatDivision.division_int(abs(value.numerator), value.denominator, base)
+
+        # The parts found by division are valid and canonical.
+        return type(self)(
+            self.sign,
+            integer_part,
+            non_repeating_part,
+            repeating_part,
+            base,
+            False,
+            False,
+        )
+
+
+class FrozenRadix(Radix):
+    """
+    An immutable Radix, which may be hashed and shared.
+
+    The digits are held in tuples, or in bytes if given as bytes. The
+    attributes can not be set after initialization. Copies of a value are
+    the value itself.
+    """
+
+    __slots__ = ("_hash",)
+
+    @staticmethod
+    def _freeze_digits(value):
+        """
+        An immutable sequence of digits.
+
+        :param value: the sequence
+        :type value: sequence of int
+        :returns: value if it is a tuple or bytes, otherwise a tuple
+        :rtype: tuple of int or bytes
+
+        Complexity: O(1) if value is immutable, otherwise O(len(value))
+        """
+        if isinstance(value, (tuple, bytes)):
+            return value
+        return tuple(value)
+
+    def _initialize(  # pylint: disable=too-many-arguments
+        self, sign, base, integer_part, non_repeating_part, repeating_part
+    ):
+        for (name, value) in (
+            ("sign", sign),
+            ("base", base),
+            ("integer_part", self._freeze_digits(integer_part)),
+            ("non_repeating_part", self._freeze_digits(non_repeating_part)),
+            ("repeating_part", self._freeze_digits(repeating_part)),
+        ):
+            object.__setattr__(self, name, value)
+
+    def __setattr__(self, name, value):
+        raise BasesInvalidOperationError(f"setting {name}")
+
+    def __delattr__(self, name):
+        raise BasesInvalidOperationError(f"deleting {name}")
+
+    def __hash__(self):
+        # Digits in bytes and in tuples that are equal must hash the same.
+        value = getattr(self, "_hash", None)
+        if value is None:
+            value = hash(
+                (
+                    self.sign,
+                    tuple(self.integer_part),
+                    tuple(self.non_repeating_part),
+                    tuple(self.repeating_part),
+                    self.base,
+                )
+            )
+            object.__setattr__(self, "_hash", value)
+        return value
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def frozen(self):
+        return self
@@ -21,24 +21,53 @@ Methods dealing with rationals.
 """
 
 # isort: STDLIB
-import copy
-import itertools
+import sys
 from fractions import Fraction
 
-from ._config import BasesConfig
+from ._arrays import NatArrays
+from ._cache import CachePolicies, ResultCache
 from ._constants import RoundingMethods
-from ._display import String
 from ._division import NatDivision
-from ._errors import BasesAssertError, BasesInvalidOperationError, BasesValueError
+from ._errors import BasesAssertError, BasesImportError, BasesValueError
 from ._nats import Nats
+from ._powers import Powers
+from ._radix import Radix
+
+
+def _result_size(result):
+    """
+    The number of bytes held by a cached result of from_rational.
+
+    :param result: the result
+    :type result: Radix * int
+    :rtype: int
+    """
+    (radix, _) = result
+    return (
+        sys.getsizeof(result)
+        + sys.getsizeof(radix)
+        + sys.getsizeof(radix.integer_part)
+        + sys.getsizeof(radix.non_repeating_part)
+        + sys.getsizeof(radix.repeating_part)
+    )
 
 
 class Radices:
     """
     Methods for Radices.
+
+    Results of from_rational may be cached, see set_cache(). Cached results
+    are FrozenRadix values, so that they may be shared.
     """
 
-    # pylint: disable=too-few-public-methods
+    # The least number of parts with the same base and length, and the
+    # greatest length and base, for the parts to be converted together.
+    _ARRAY_MIN_PARTS = 2**4
+    _ARRAY_MAX_DIGITS = 2**8
+    _ARRAY_MAX_BASE = 2**32
+
+    # The cache of results of from_rational, disabled by default.
+    _CACHE = ResultCache(_result_size)
 
     @staticmethod
     def _reverse_rounding_method(method):
@@ -74,15 +103,38 @@ class Radices:
         :rtype: Radix * int
         :raises BasesValueError: if to_base is less than 2
 
+        If the cache is enabled, results are looked up in it first, and
+        the same result may be returned by many calls. Cached results are
+        FrozenRadix values, so that they may be shared.
+
         Complexity: Uncalculated.
         """
-        # pylint: disable=too-many-locals
         if to_base < 2:
             raise BasesValueError(to_base, "to_base", "must be at least 2")
 
         if precision is not None and precision < 0:
             raise BasesValueError(precision, "precision", "must be at least 0")
 
+        return cls._CACHE.lookup(
+            (value.numerator, value.denominator, to_base, precision, method),
+            lambda: cls._from_rational(value, to_base, precision, method),
+            lambda result: (result[0].frozen(), result[1]),
+        )
+
+    @classmethod
+    def _from_rational(cls, value, to_base, precision, method):
+        """
+        Convert rational value to a base, without consulting the cache.
+
+        :param Rational value: the value to convert
+        :param int to_base: base of result, must be at least 2
+        :param precision: number of digits in total or None
+        :type precision: int or NoneType
+        :param method: rounding method
+        :type method: element of RoundingMethods.METHODS()
+        :returns: the conversion result and its relation to actual result
+        :rtype: Radix * int
+        """
         if value == 0:
             non_repeating_part = [] if precision is None else precision * [0]
             return (Radix(0, [], non_repeating_part, [], to_base), 0)
@@ -98,539 +150,263 @@ class Radices:
             value = abs(value)
             div_method = cls._reverse_rounding_method(method)
 
-        numerator = Nats.convert_from_int(value.numerator, to_base)
-        denominator = Nats.convert_from_int(value.denominator, to_base)
+        if precision is not None:
+            return cls._from_rational_rounded(
+                sign, value, to_base, precision, div_method
+            )
 
         (
             integer_part,
             non_repeating_part,
             repeating_part,
             relation,
-        ) = NatDivision.division(denominator, numerator, to_base, precision, div_method)
-
-        relation = relation * sign
+        ) = NatDivision.division_int(value.numerator, value.denominator, to_base)
 
-        result = Radix(sign, integer_part, non_repeating_part, repeating_part, to_base)
-
-        if precision is not None:
-            (result, rel) = result.rounded(precision, method)
-            relation = relation if rel == 0 else rel
+        # The parts found by division are valid and canonical.
+        result = Radix(
+            sign,
+            integer_part,
+            non_repeating_part,
+            repeating_part,
+            to_base,
+            False,
+            False,
+        )
 
         return (result, relation)
 
-
-class Rationals:
-    """
-    Miscellaneous methods for rationals.
-    """
-
-    # pylint: disable=too-few-public-methods
-
-    @staticmethod
-    def round_to_int(value, method):
+    @classmethod
+    def set_cache(cls, max_bytes=0, policy=CachePolicies.LRU):
         """
-        Round ``value`` to an int according to ``method``.
+        Set up the cache of results of from_rational.
 
-        :param Rational value: the value to round
-        :param method: the rounding method (of RoundingMethods.METHODS())
-
-        :returns: rounded value and relation of rounded value to actual value.
-        :rtype: (int * int)
+        :param int max_bytes: the bound on the bytes held, 0 to disable
+        :param policy: the eviction policy
+        :type policy: element of CachePolicies.POLICIES()
+        :raises BasesValueError: if max_bytes or policy is invalid
 
-        Complexity: O(1)
+        Any previously cached results and statistics are discarded.
         """
-        # pylint: disable=too-many-return-statements
-        if value.denominator == 1:
-            return (value.numerator, 0)
-
-        int_value = int(value)
-        if int_value < value:
-            (lower, upper) = (int_value, int_value + 1)
-        else:
-            (lower, upper) = (int_value - 1, int_value)
-
-        if method is RoundingMethods.ROUND_DOWN:
-            return (lower, -1)
-
-        if method is RoundingMethods.ROUND_UP:
-            return (upper, 1)
-
-        if method is RoundingMethods.ROUND_TO_ZERO:
-            return (upper, 1) if lower < 0 else (lower, -1)
-
-        delta = value - lower
-
-        if method is RoundingMethods.ROUND_HALF_UP:
-            return (upper, 1) if delta >= Fraction(1, 2) else (lower, -1)
-
-        if method is RoundingMethods.ROUND_HALF_DOWN:
-            return (lower, -1) if delta <= Fraction(1, 2) else (upper, 1)
-
-        if method is RoundingMethods.ROUND_HALF_ZERO:
-            if lower < 0:
-                return (upper, 1) if delta >= Fraction(1, 2) else (lower, -1)
-            return (lower, -1) if delta <= Fraction(1, 2) else (upper, 1)
-
-        raise BasesValueError(method, "method")
-
-
-class Radix:
-    """
-    An object containing information about a rational representation.
-
-    Such values can not be ordered, but can be compared for equality.
-    """
-
-    # pylint: disable=too-few-public-methods
-
-    _FMT_STR = "".join(
-        [
-            "%(sign)s",
-            "%(left)s",
-            "%(radix)s",
-            "%(non_repeat)s",
-            "%(repeat)s",
-            "_",
-            "%(base)s",
-        ]
-    )
+        cls._CACHE.set(max_bytes, policy)
 
     @classmethod
-    def _validate(  # pylint: disable=too-many-arguments
-        cls, sign, integer_part, non_repeating_part, repeating_part, base
-    ):
+    def clear_cache(cls):
         """
-        Check if radix is valid.
-
-        :param int sign: -1, 0, or 1 as appropriate
-        :param integer_part: the part on the left side of the radix
-        :type integer_part: list of int
-        :param non_repeating_part: non repeating part on left side
-        :type non_repeating_part: list of int
-        :param repeating_part: repeating part
-        :type repeating_part: list of int
-        :param int base: base of the radix, must be at least 2
-
-        :returns: BasesValueError if invalid values
-        :rtype: BasesValueError or NoneType
-
-        Complexity: O(len(integer_part + non_repeating_part + repeating_part))
+        Empty the cache of results of from_rational and reset its statistics.
         """
-        if any(x < 0 or x >= base for x in integer_part):
-            return BasesValueError(
-                integer_part, "integer_part", "values must be between 0 and {base}"
-            )
-        if any(x < 0 or x >= base for x in non_repeating_part):
-            return BasesValueError(
-                non_repeating_part,
-                "non_repeating_part",
-                "values must be between 0 and {base}",
-            )
-        if any(x < 0 or x >= base for x in repeating_part):
-            return BasesValueError(
-                repeating_part,
-                "repeating_part",
-                "values must be between 0 and {base}",
-            )
-        if base < 2:
-            return BasesValueError(base, "base", "must be at least 2")
-
-        if sign not in (-1, 0, 1) or sign is True or sign is False:
-            return BasesValueError(sign, "sign", "must be an int between -1 and 1")
-
-        return None
+        cls._CACHE.clear()
 
     @classmethod
-    def _repeat_length(cls, part):
+    def cache_info(cls):
         """
-        The length of the repeated portions of ``part``.
-
-        :param part: a number
-        :type part: list of int
-        :returns: the first index at which part repeats
-        :rtype: int
+        Statistics about the cache of results of from_rational.
 
-        If part does not repeat, result is the length of part.
-
-        Complexity: O(len(part)^2)
+        :returns: hits, misses, number of entries, bytes held and bound
+        :rtype: CacheInfo
         """
-        repeat_len = len(part)
-        if repeat_len == 0:
-            return repeat_len
-
-        first_digit = part[0]
-        limit = repeat_len // 2 + 1
-        indices = (i for i in range(1, limit) if part[i] == first_digit)
-        for index in indices:
-            (quot, rem) = divmod(repeat_len, index)
-            if rem == 0:
-                first_chunk = part[0:index]
-                if all(
-                    first_chunk == part[x : x + index]
-                    for x in range(index, quot * index, index)
-                ):
-                    return index
-        return repeat_len
+        return cls._CACHE.info()
 
-    @classmethod
-    def _canonicalize_fraction(cls, non_repeating, repeating):
+    @staticmethod
+    def _from_rational_rounded(sign, value, to_base, precision, method):
         """
-        If the same fractional value can be represented by stripping repeating
-        part from ``non_repeating``, do it.
+        Convert positive rational value to a base, rounded to ``precision``
+        fractional digits.
 
-        :param non_repeating: non repeating part of fraction
-        :type non_repeating: list of int
-        :param repeating: repeating part of fraction
-        :type repeating: list of int
-        :returns: new non_repeating and repeating parts
-        :rtype: tuple of list of int * list of int
+        :param int sign: the sign of the result, -1 or 1
+        :param Rational value: the value to convert, greater than 0
+        :param int to_base: base of result, must be at least 2
+        :param int precision: number of fractional digits
+        :param method: rounding method, as applied to value
+        :type method: element of RoundingMethods.METHODS()
+        :returns: the conversion result and its relation to actual result
+        :rtype: Radix * int
+        :raises BasesValueError: if method is invalid
 
-        Complexity: O(len(non_repeating))
-        """
-        if repeating == []:
-            return (non_repeating, repeating)
-
-        repeat_len = len(repeating)
-
-        # strip all exact matches:
-        # * for [6, 1, 2, 1, 2], [1,2] end is 1
-        # * for [1, 2, 1, 2], [1,2] end is 0
-        # * for [6, 2, 1, 2], [1,2] end is 2
-        indices = range(len(non_repeating), -1, -repeat_len)
-        end = next(  # pragma: no cover
-            i for i in indices if non_repeating[(i - repeat_len) : i] != repeating
-        )
+        All the digits are found by a single division, which also yields
+        the remainder that decides the rounding. The Radix is built once,
+        in canonical form.
 
-        # for remaining, find partial match and shift repeating
-        # * for [6, 2, 1, 2], [1, 2] initial end is 2, result is [6], [2, 1]
-        indices = range(min(repeat_len - 1, end), 0, -1)
-        index = next(
-            (i for i in indices if repeating[-i:] == non_repeating[(end - i) : end]), 0
-        )
-        return (non_repeating[: (end - index)], repeating[-index:] + repeating[:-index])
-
-    def __init__(  # pylint: disable=too-many-arguments
-        self,
-        sign,
-        integer_part,
-        non_repeating_part,
-        repeating_part,
-        base,
-        validate=True,
-        canonicalize=True,
-    ):
+        Complexity: O(M(n)), n the number of digits in the result and M
+        the complexity of multiplication
         """
-        Initializer.
-
-        :param int sign: -1, 0, or 1 as appropriate
-        :param integer_part: the part on the left side of the radix
-        :type integer_part: list of int
-        :param non_repeating_part: non repeating part on left side
-        :type non_repeating_part: list of int
-        :param repeating_part: repeating part
-        :type repeating_part: list of int
-        :param int base: base of the radix, must be at least 2
-        :param bool validate: if True, validate the arguments
-        :param bool canonicalize: if True, canonicalize
-
-        Validation and canonicalization are expensive and may be omitted.
-
-        Complexity: polynomial in number of digits if canonicalize is True,
-        linear if validate is True, otherwise constant time
-        """
-        if validate:
-            error = self._validate(
-                sign, integer_part, non_repeating_part, repeating_part, base
-            )
-            if error is not None:
-                raise error  # pylint: disable=raising-bad-type
-
-        if canonicalize:
-            if all(x == 0 for x in integer_part):
-                integer_part = []
-
-            repeating_part = repeating_part[0 : self._repeat_length(repeating_part)]
-            (non_repeating_part, repeating_part) = self._canonicalize_fraction(
-                non_repeating_part, repeating_part
+        # pylint: disable=too-many-arguments
+        if method not in RoundingMethods.METHODS():
+            raise BasesValueError(
+                method, "method", "must be one of RoundingMethod.METHODS()"
             )
-            if all(x == 0 for x in repeating_part):
-                repeating_part = []
 
-            if repeating_part == [base - 1]:
-                repeating_part = []
-                (carry_out, non_repeating_part) = Nats.carry_in(
-                    non_repeating_part, 1, base
-                )
-                if carry_out != 0:
-                    (carry_out, integer_part) = Nats.carry_in(integer_part, 1, base)
-                    if carry_out != 0:
-                        integer_part = [carry_out] + integer_part
+        shift = Powers.power(to_base, precision)
+        (quotient, remainder) = divmod(value.numerator * shift, value.denominator)
 
+        relation = 0
+        if remainder != 0:
+            twice = 2 * remainder
             if (
-                integer_part == []
-                and repeating_part == []
-                and all(x == 0 for x in non_repeating_part)
+                method is RoundingMethods.ROUND_UP
+                or (
+                    method is RoundingMethods.ROUND_HALF_UP
+                    and twice >= value.denominator
+                )
+                or (
+                    method
+                    in (
+                        RoundingMethods.ROUND_HALF_DOWN,
+                        RoundingMethods.ROUND_HALF_ZERO,
+                    )
+                    and twice > value.denominator
+                )
             ):
-                sign = 0
-
-        self.sign = sign
-        self.base = base
-        self.integer_part = integer_part
-        self.non_repeating_part = non_repeating_part
-        self.repeating_part = repeating_part
+                (quotient, relation) = (quotient + 1, 1)
+            else:
+                relation = -1
 
-    def getString(self, config, relation=0):  # pylint: disable=invalid-name
-        """
-        Return a representation of a Radix according to config.
-
-        :param DisplayConfig config: configuration
-        :param int relation: the relation of this value to actual value
-        """
-        return String(config, self.base).xform(self, relation)
+        (integer, fraction) = divmod(quotient, shift)
+        digits = Nats.convert_from_int(fraction, to_base)
+        non_repeating_part = (precision - len(digits)) * [0] + digits
 
-    def __str__(self):
-        return self.getString(BasesConfig.DISPLAY_CONFIG, 0)
-
-    def __repr__(self):
-        return (
-            f"Radix({self.sign},{self.integer_part},"
-            f"{self.non_repeating_part},{self.repeating_part},{self.base})"
-        )
-
-    def __eq__(self, other):
-        if not isinstance(other, Radix):
-            raise BasesInvalidOperationError("!=", other)
-        return (
-            self.sign == other.sign
-            and self.integer_part == other.integer_part
-            and self.non_repeating_part == other.non_repeating_part
-            and self.repeating_part == other.repeating_part
-            and self.base == other.base
-        )
-
-    def __ne__(self, other):
-        if not isinstance(other, Radix):
-            raise BasesInvalidOperationError("!=", other)
-        return (
-            self.sign != other.sign
-            or self.integer_part != other.integer_part
-            or self.non_repeating_part != other.non_repeating_part
-            or self.repeating_part != other.repeating_part
-            or self.base != other.base
+        result = Radix(
+            sign if quotient != 0 else 0,
+            Nats.convert_from_int(integer, to_base),
+            non_repeating_part,
+            [],
+            to_base,
+            False,
+            False,
         )
+        return (result, relation * sign)
 
-    def __lt__(self, other):
-        raise BasesInvalidOperationError("<")
-
-    def __gt__(self, other):
-        raise BasesInvalidOperationError(">")
-
-    def __le__(self, other):
-        raise BasesInvalidOperationError("<=")
-
-    def __ge__(self, other):
-        raise BasesInvalidOperationError(">=")
-
-    def __copy__(self):  # pragma: no cover
-        return Radix(
-            self.sign,
-            self.integer_part,
-            self.non_repeating_part,
-            self.repeating_part,
-            self.base,
-        )
+    @classmethod
+    def as_rationals(cls, values):
+        """
+        Convert many Radix values to rationals.
 
-    def __deepcopy__(self, memo):
-        return Radix(
-            self.sign,
-            self.integer_part[:],
-            self.non_repeating_part[:],
-            self.repeating_part[:],
-            self.base,
-        )
+        :param values: the values to convert
+        :type values: sequence of Radix
+        :returns: the values as rationals
+        :rtype: list of Rational
 
-    def as_rational(self):
-        """
-        Return this value as a Rational.
+        Short parts with the same base and length are converted to ints
+        together by NatArrays, if NumPy is installed. Each rational is then
+        found with a single gcd.
 
-        :returns: this radix as a rational
-        :rtype: Rational
+        Complexity: O(number of digits in values)
         """
-        (denominator, numerator) = NatDivision.undivision(
-            self.integer_part, self.non_repeating_part, self.repeating_part, self.base
+        # pylint: disable=protected-access
+        bases = [value.base for value in values]
+        integers = cls._convert_parts([value.integer_part for value in values], bases)
+        non_repeatings = cls._convert_parts(
+            [value.non_repeating_part for value in values], bases
         )
-        result = Fraction(
-            Nats.convert_to_int(numerator, self.base),
-            Nats.convert_to_int(denominator, self.base),
+        repeatings = cls._convert_parts(
+            [value.repeating_part for value in values], bases
         )
-        return result * self.sign
-
-    def as_int(self, method):
-        """
-        This value as an int, rounded according to ``method``.
 
-        :param method: rounding method
-        :raises BasesValueError: on bad parameters
+        result = []
+        for (value, integer, non_repeating, repeating) in zip(
+            values, integers, non_repeatings, repeatings
+        ):
+            (divisor, dividend) = NatDivision._undivision(
+                integer,
+                non_repeating,
+                len(value.non_repeating_part),
+                repeating,
+                len(value.repeating_part),
+                value.base,
+            )
+            result.append(Fraction(value.sign * dividend, divisor))
+        return result
 
-        :returns: corresponding int value
-        :rtype: int
+    @classmethod
+    def _convert_parts(cls, parts, bases):
         """
-        (new_radix, relation) = self.rounded(0, method)
-        value = Nats.convert_to_int(new_radix.integer_part, new_radix.base)
-        return (value * self.sign, relation)
+        Convert parts, each in its own base, to ints.
 
-    def rounded(self, precision, method):
-        """
-        This value with fractional part rounded to ``precision`` digits
-        according to ``method``.
+        :param parts: the parts
+        :type parts: list of sequence of int
+        :param bases: the base of each part
+        :type bases: list of int
+        :returns: the value of each part
+        :rtype: list of int
 
-        :param int precision: number of digits in total
-        :param method: rounding method
-        :raises BasesValueError: on bad parameters
-
-        Precondition: Radix is valid and canonical
-
-        Complexity: O(len(components))
+        Complexity: O(number of digits in parts)
         """
-        return _Rounding.roundFractional(self, precision, method)
+        groups = {}
+        for (index, (part, base)) in enumerate(zip(parts, bases)):
+            groups.setdefault((base, len(part)), []).append(index)
 
-    def in_base(self, base):
-        """
-        Return value in ``base``.
+        result = len(parts) * [0]
+        for ((base, length), indices) in groups.items():
+            if length == 0:
+                continue
 
-        :returns: Radix in ``base``
-        :rtype: Radix
-        :raises ConvertError: if ``base`` is less than 2
-        """
-        if base == self.base:
-            return copy.deepcopy(self)
-        (result, _) = Radices.from_rational(self.as_rational(), base)
+            if (
+                len(indices) >= cls._ARRAY_MIN_PARTS
+                and length <= cls._ARRAY_MAX_DIGITS
+                and base <= cls._ARRAY_MAX_BASE
+            ):
+                matrix = [list(parts[index]) for index in indices]
+                try:
+                    values = NatArrays.convert_to_int(matrix, base)
+                except BasesImportError:  # pragma: no cover
+                    pass
+                else:
+                    for (index, value) in zip(indices, values):
+                        result[index] = value
+                    continue
+
+            for index in indices:
+                result[index] = Nats.convert_to_int(parts[index], base)
         return result
 
 
-class _Rounding:
+class Rationals:
     """
-    Rounding of radix objects.
+    Miscellaneous methods for rationals.
     """
 
     # pylint: disable=too-few-public-methods
 
     @staticmethod
-    def _conditional_toward_zero(method, sign):
-        """
-        Whether to round toward zero.
-
-        :param method: rounding method
-        :type method: element of RoundingMethods.METHODS()
-        :param int sign: -1, 0, or 1 as appropriate
-
-        Complexity: O(1)
-        """
-        return (
-            method is RoundingMethods.ROUND_HALF_ZERO
-            or (method is RoundingMethods.ROUND_HALF_DOWN and sign == 1)
-            or (method is RoundingMethods.ROUND_HALF_UP and sign == -1)
-        )
-
-    @staticmethod
-    def _increment(sign, integer_part, non_repeating_part, base):
-        """
-        Return an increment radix.
-
-        :param int sign: -1, 0, or 1 as appropriate
-        :param integer_part: the integer part
-        :type integer_part: list of int
-        :param non_repeating_part: the fractional part
-        :type non_repeating_part: list of int
-        :param int base: the base
-
-        :returns: a Radix object with ``non_repeating_part`` rounded up
-        :rtype: Radix
-
-        Complexity: O(len(non_repeating_part + integer_part)
-        """
-        (carry, non_repeating_part) = Nats.carry_in(non_repeating_part, 1, base)
-        (carry, integer_part) = Nats.carry_in(integer_part, carry, base)
-        return Radix(
-            sign,
-            integer_part if carry == 0 else [carry] + integer_part,
-            non_repeating_part,
-            [],
-            base,
-            False,
-        )
-
-    @classmethod
-    def roundFractional(cls, value, precision, method):  # pylint: disable=invalid-name
+    def round_to_int(value, method):
         """
-        Round to precision as number of digits after radix.
+        Round ``value`` to an int according to ``method``.
 
-        :param Radix value: value to round
-        :param int precision: number of digits in total
-        :param method: rounding method
-        :raises BasesValueError: on bad parameters
+        :param Rational value: the value to round
+        :param method: the rounding method (of RoundingMethods.METHODS())
 
-        Precondition: Radix is valid and canonical
+        :returns: rounded value and relation of rounded value to actual value.
+        :rtype: (int * int)
 
-        Complexity: O(len(components))
+        Complexity: O(1)
         """
         # pylint: disable=too-many-return-statements
-        # pylint: disable=too-many-branches
-
-        if precision < 0:
-            raise BasesValueError(precision, "precision", "must be at least 0")
-
-        if method not in RoundingMethods.METHODS():
-            raise BasesValueError(
-                method, "method", "must be one of RoundingMethod.METHODS()"
-            )
+        if value.denominator == 1:
+            return (value.numerator, 0)
 
-        if value.sign == 0:
-            return (Radix(0, [], precision * [0], [], value.base), 0)
+        (lower, delta) = divmod(value.numerator, value.denominator)
+        upper = lower + 1
 
-        digits = itertools.chain(
-            value.non_repeating_part, itertools.cycle(value.repeating_part)
-        )
-        non_repeating_part = list(itertools.islice(digits, 0, precision))
-        non_repeating_part += (precision - len(non_repeating_part)) * [0]
+        if method is RoundingMethods.ROUND_DOWN:
+            return (lower, -1)
 
-        truncated = lambda: Radix(
-            value.sign, value.integer_part, non_repeating_part, [], value.base, False
-        )
+        if method is RoundingMethods.ROUND_UP:
+            return (upper, 1)
 
-        incremented = lambda: cls._increment(
-            value.sign, value.integer_part, non_repeating_part, value.base
-        )
+        if method is RoundingMethods.ROUND_TO_ZERO:
+            return (upper, 1) if lower < 0 else (lower, -1)
 
-        if (
-            all(x == 0 for x in value.non_repeating_part[precision:])
-            and value.repeating_part == []
-        ):
-            return (truncated(), 0)
+        # Compare value - lower, i.e., delta / denominator, with 1 / 2.
+        (delta, middle) = (2 * delta, value.denominator)
 
-        if method is RoundingMethods.ROUND_TO_ZERO:
-            return (truncated(), -1 * value.sign)
+        if method is RoundingMethods.ROUND_HALF_UP:
+            return (upper, 1) if delta >= middle else (lower, -1)
 
-        if method is RoundingMethods.ROUND_DOWN:
-            return (truncated() if value.sign == 1 else incremented(), -1)
+        if method is RoundingMethods.ROUND_HALF_DOWN:
+            return (lower, -1) if delta <= middle else (upper, 1)
 
-        if method is RoundingMethods.ROUND_UP:
-            return (incremented() if value.sign == 1 else truncated(), 1)
+        if method is RoundingMethods.ROUND_HALF_ZERO:
+            if lower < 0:
+                return (upper, 1) if delta >= middle else (lower, -1)
+            return (lower, -1) if delta <= middle else (upper, 1)
 
-        non_repeating_remainder = value.non_repeating_part[precision:]
-        if non_repeating_remainder == []:
-            repeating_part = list(itertools.islice(digits, len(value.repeating_part)))
-        else:
-            repeating_part = value.repeating_part[:]
-
-        remainder = Radix(1, [], non_repeating_remainder, repeating_part, value.base)
-        remainder_fraction = remainder.as_rational()
-        middle = Fraction(1, 2)
-        if remainder_fraction < middle:
-            return (truncated(), -1 * value.sign)
-        if remainder_fraction > middle:
-            return (incremented(), value.sign)
-
-        if cls._conditional_toward_zero(method, value.sign):
-            return (truncated(), -1 * value.sign)
-        return (incremented(), value.sign)
+        raise BasesValueError(method, "method")
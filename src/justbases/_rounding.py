@@ -0,0 +1,203 @@
+# Copyright (C) 2015 - 2019 Red Hat, Inc.
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or any later version.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; If not, see <http://www.gnu.org/licenses/>.
+#
+# Red Hat Author(s): Anne Mulhern <amulhern@redhat.com>
+# Other author(s): Anne Mulhern <mulhern@cs.wisc.edu>
+
+"""
+Rounding of radix objects.
+"""
+
+# isort: STDLIB
+import itertools
+
+from ._constants import RoundingMethods
+from ._errors import BasesValueError
+from ._nats import Nats
+
+
+class Rounding:
+    """
+    Rounding of radix objects.
+    """
+
+    # pylint: disable=too-few-public-methods
+
+    @staticmethod
+    def _conditional_toward_zero(method, sign):
+        """
+        Whether to round toward zero.
+
+        :param method: rounding method
+        :type method: element of RoundingMethods.METHODS()
+        :param int sign: -1, 0, or 1 as appropriate
+
+        Complexity: O(1)
+        """
+        return (
+            method is RoundingMethods.ROUND_HALF_ZERO
+            or (method is RoundingMethods.ROUND_HALF_DOWN and sign == 1)
+            or (method is RoundingMethods.ROUND_HALF_UP and sign == -1)
+        )
+
+    @staticmethod
+    def _increment(  # pylint: disable=too-many-arguments
+        radix_type, sign, integer_part, non_repeating_part, base
+    ):
+        """
+        Return an increment radix.
+
+        :param type radix_type: the type of the result, Radix or FrozenRadix
+        :param int sign: -1, 0, or 1 as appropriate
+        :param integer_part: the integer part
+        :type integer_part: list of int
+        :param non_repeating_part: the fractional part
+        :type non_repeating_part: list of int
+        :param int base: the base
+
+        :returns: a radix with ``non_repeating_part`` rounded up
+        :rtype: radix_type
+
+        Complexity: O(len(non_repeating_part + integer_part)
+        """
+        (carry, non_repeating_part) = Nats.carry_in(non_repeating_part, 1, base)
+        (carry, integer_part) = Nats.carry_in(integer_part, carry, base)
+        return radix_type(
+            sign,
+            integer_part if carry == 0 else [carry] + integer_part,
+            non_repeating_part,
+            [],
+            base,
+            False,
+        )
+
+    @staticmethod
+    def _compare_to_half(non_repeating_part, repeating_part, base):
+        """
+        Compare the value of fractional digits with one half.
+
+        :param non_repeating_part: the non-repeating part
+        :type non_repeating_part: sequence of int
+        :param repeating_part: the repeating part
+        :type repeating_part: sequence of int
+        :param int base: the base
+
+        :returns: -1, 0, or 1 as the value is less than, equal to, or
+          greater than one half
+        :rtype: int
+
+        In an even base, one half is the digit base // 2 followed by 0s; in
+        an odd base, it is the digit base // 2 repeated. The digits are
+        compared with these until they differ. Both sequences repeat with
+        a period of len(repeating_part) once the non-repeating part and
+        one digit are past, so if they agree that far they are equal.
+
+        Precondition: the repeating part does not consist only of the
+        digit base - 1.
+
+        Complexity: O(number of digits examined)
+        """
+        if base % 2 == 0:
+            half = itertools.chain([base // 2], itertools.repeat(0))
+        else:
+            half = itertools.repeat(base // 2)
+
+        digits = itertools.chain(
+            non_repeating_part, itertools.cycle(repeating_part or [0])
+        )
+        length = max(len(non_repeating_part), 1) + max(len(repeating_part), 1)
+        for (digit, middle) in zip(itertools.islice(digits, length), half):
+            if digit != middle:
+                return -1 if digit < middle else 1
+        return 0
+
+    @classmethod
+    def roundFractional(cls, value, precision, method):  # pylint: disable=invalid-name
+        """
+        Round to precision as number of digits after radix.
+
+        :param Radix value: value to round
+        :param int precision: number of digits in total
+        :param method: rounding method
+        :raises BasesValueError: on bad parameters
+        :returns: the rounded value, of the same type as value, and its
+           relation to value
+        :rtype: Radix * int
+
+        Precondition: Radix is valid and canonical
+
+        Complexity: O(len(components))
+        """
+        # pylint: disable=too-many-return-statements
+        # pylint: disable=too-many-branches
+
+        if precision < 0:
+            raise BasesValueError(precision, "precision", "must be at least 0")
+
+        if method not in RoundingMethods.METHODS():
+            raise BasesValueError(
+                method, "method", "must be one of RoundingMethod.METHODS()"
+            )
+
+        radix_type = type(value)
+        if value.sign == 0:
+            return (radix_type(0, [], precision * [0], [], value.base), 0)
+
+        digits = itertools.chain(
+            value.non_repeating_part, itertools.cycle(value.repeating_part)
+        )
+        non_repeating_part = list(itertools.islice(digits, 0, precision))
+        non_repeating_part += (precision - len(non_repeating_part)) * [0]
+
+        truncated = lambda: radix_type(
+            value.sign, value.integer_part, non_repeating_part, [], value.base, False
+        )
+
+        incremented = lambda: cls._increment(
+            radix_type, value.sign, value.integer_part, non_repeating_part, value.base
+        )
+
+        if (
+            all(x == 0 for x in value.non_repeating_part[precision:])
+            and not value.repeating_part
+        ):
+            return (truncated(), 0)
+
+        if method is RoundingMethods.ROUND_TO_ZERO:
+            return (truncated(), -1 * value.sign)
+
+        if method is RoundingMethods.ROUND_DOWN:
+            return (truncated() if value.sign == 1 else incremented(), -1)
+
+        if method is RoundingMethods.ROUND_UP:
+            return (incremented() if value.sign == 1 else truncated(), 1)
+
+        non_repeating_remainder = value.non_repeating_part[precision:]
+        if not non_repeating_remainder:
+            repeating_part = list(itertools.islice(digits, len(value.repeating_part)))
+        else:
+            repeating_part = value.repeating_part
+
+        relation = cls._compare_to_half(
+            non_repeating_remainder, repeating_part, value.base
+        )
+        if relation == -1:
+            return (truncated(), -1 * value.sign)
+        if relation == 1:
+            return (incremented(), value.sign)
+
+        if cls._conditional_toward_zero(method, value.sign):
+            return (truncated(), -1 * value.sign)
+        return (incremented(), value.sign)
@@ -0,0 +1,109 @@
+# Copyright (C) 2015 - 2019 Red Hat, Inc.
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or any later version.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; If not, see <http://www.gnu.org/licenses/>.
+#
+# Red Hat Author(s): Anne Mulhern <amulhern@redhat.com>
+# Other Author(s): Anne Mulhern <mulhern@cs.wisc.edu>
+
+""" Test for conversions of arrays. """
+
+# isort: STDLIB
+import os
+import subprocess
+import sys
+import unittest
+
+# isort: LOCAL
+from justbases import BasesError, NatArrays, NatDivision
+
+try:
+    # isort: THIRDPARTY
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
+
+
+class ImportTestCase(unittest.TestCase):
+    """Tests for importing NumPy."""
+
+    def test_lazy_import(self):
+        """Test that importing justbases does not import NumPy."""
+        env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+        result = subprocess.run(
+            [
+                sys.executable,
+                "-c",
+                "import sys, justbases; sys.exit('numpy' in sys.modules)",
+            ],
+            env=env,
+            check=False,
+        )
+        self.assertEqual(result.returncode, 0)
+
+
+@unittest.skipIf(numpy is None, "NumPy is not installed")
+class NatArraysTestCase(unittest.TestCase):
+    """Tests for arrays of ints."""
+
+    def test_exceptions(self):
+        """Test throwing exception."""
+        with self.assertRaises(BasesError):
+            NatArrays.convert_to_int(numpy.zeros((2, 2), dtype=numpy.uint8), 1)
+        with self.assertRaises(BasesError):
+            NatArrays.convert_to_int(numpy.zeros(2, dtype=numpy.uint8), 2)
+        with self.assertRaises(BasesError):
+            NatArrays.convert_to_int(numpy.zeros((2, 2)), 2)
+        with self.assertRaises(BasesError):
+            NatArrays.convert_to_int(numpy.array([[1, 2]], dtype=numpy.uint8), 2)
+        with self.assertRaises(BasesError):
+            NatArrays.convert_to_int(numpy.array([[1, -1]], dtype=numpy.int8), 2)
+
+    def test_convert_to_int(self):
+        """Test converting rows of several chunks."""
+        value = numpy.array([30 * [35], 29 * [0] + [1], 30 * [0]], dtype=numpy.uint8)
+        self.assertEqual(NatArrays.convert_to_int(value, 36), [36**30 - 1, 1, 0])
+
+    def test_empty(self):
+        """Test converting matrices with no rows or no columns."""
+        self.assertEqual(
+            NatArrays.convert_to_int(numpy.zeros((0, 3), dtype=numpy.uint8), 10), []
+        )
+        self.assertEqual(
+            NatArrays.convert_to_int(numpy.zeros((2, 0), dtype=numpy.uint8), 10),
+            [0, 0],
+        )
+
+    def test_division_int_exceptions(self):
+        """Test throwing exception when dividing."""
+        with self.assertRaises(BasesError):
+            NatArrays.division_int([1], [3], 1)
+        with self.assertRaises(BasesError):
+            NatArrays.division_int([1, 2], [3], 10)
+        with self.assertRaises(BasesError):
+            NatArrays.division_int([-1], [3], 10)
+        with self.assertRaises(BasesError):
+            NatArrays.division_int([1], [0], 10)
+
+    def test_division_int(self):
+        """Test a batch mixing divisions done in lockstep and one at a time."""
+        numerators = [0, 1, 22, 1, 1, 2**70 + 1, 1]
+        denominators = [7, 3, 7, 8, 2**62, 3, 10007]
+        self.assertEqual(
+            NatArrays.division_int(numerators, denominators, 10),
+            [
+                NatDivision.division_int(numerator, denominator, 10)
+                for (numerator, denominator) in zip(numerators, denominators)
+            ],
+        )
+        self.assertEqual(NatArrays.division_int([], [], 10), [])
@@ -0,0 +1,112 @@
+# Copyright (C) 2015 - 2019 Red Hat, Inc.
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or any later version.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; If not, see <http://www.gnu.org/licenses/>.
+#
+# Red Hat Author(s): Anne Mulhern <amulhern@redhat.com>
+# Other Author(s): Anne Mulhern <mulhern@cs.wisc.edu>
+
+""" Test for caches. """
+
+# isort: STDLIB
+import unittest
+
+# isort: LOCAL
+from justbases import BasesError
+from justbases._cache import Cache, CachePolicies
+
+
+class CacheTestCase(unittest.TestCase):
+    """Tests for caches."""
+
+    def test_exceptions(self):
+        """Test throwing exception."""
+        with self.assertRaises(BasesError):
+            Cache(-1)
+        with self.assertRaises(BasesError):
+            Cache(1, None)
+        with self.assertRaises(BasesError):
+            Cache(1).set_max_bytes(-1)
+
+    def test_lru(self):
+        """Test that the least recently used values are evicted."""
+        cache = Cache(2, CachePolicies.LRU, lambda _: 1)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        self.assertEqual(cache.get("a"), 1)
+        self.assertEqual(cache.get("a"), 1)
+        cache.put("c", 3)
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("c"), 3)
+        self.assertEqual(tuple(cache.info()), (3, 1, 2, 2, 2))
+
+        cache.set_max_bytes(1)
+        self.assertIsNone(cache.get("a"))
+        cache.clear()
+        self.assertEqual(tuple(cache.info()), (0, 0, 0, 0, 1))
+
+    def test_lfu(self):
+        """Test that the least frequently used values are evicted."""
+        cache = Cache(2, CachePolicies.LFU, lambda _: 1)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.get("a")
+        cache.get("a")
+        cache.get("b")
+        cache.put("c", 3)
+        self.assertIsNone(cache.get("b"))
+        cache.put("d", 4)
+        self.assertIsNone(cache.get("c"))
+        self.assertEqual(cache.get("a"), 1)
+        self.assertEqual(cache.get("d"), 4)
+
+    def test_lfu_sparse_uses(self):
+        """Test evicting several values with widely spread numbers of uses."""
+        cache = Cache(4, CachePolicies.LFU, lambda _: 1)
+        for key in "abcd":
+            cache.put(key, key)
+        for _ in range(5):
+            cache.get("d")
+        cache.get("b")
+        cache.get("b")
+        cache.set_max_bytes(2)
+        self.assertEqual(cache.info().entries, 2)
+        self.assertIsNone(cache.get("a"))
+        self.assertIsNone(cache.get("c"))
+        cache.set_max_bytes(4)
+        cache.put("e", "e")
+        cache.put("f", "f")
+        cache.put("g", "g")
+        self.assertIsNone(cache.get("e"))
+        self.assertEqual([cache.get(key) for key in "bdfg"], list("bdfg"))
+
+    def test_policy_equality(self):
+        """Test that a policy equal to, but not identical to, LFU is LFU."""
+        policy = "".join(["least frequently", " used"])
+        self.assertIsNot(policy, CachePolicies.LFU)
+        cache = Cache(2, policy, lambda _: 1)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.get("a")
+        cache.get("a")
+        cache.get("b")
+        cache.put("c", 3)
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("a"), 1)
+
+    def test_too_large(self):
+        """Test that values larger than the bound are not cached."""
+        cache = Cache(2, CachePolicies.LRU, len)
+        cache.put("a", "xyz")
+        self.assertIsNone(cache.get("a"))
+        self.assertEqual(cache.info().entries, 0)
@@ -19,10 +19,15 @@
 """ Test for integer conversions. """
 
 # isort: STDLIB
+import array
+import itertools
+import os
+import subprocess
+import sys
 import unittest
 
 # isort: LOCAL
-from justbases import BasesError, NatDivision
+from justbases import BasesError, NatDivision, Nats
 
 
 class NatDivisionTestCase(unittest.TestCase):
@@ -46,6 +51,16 @@ class NatDivisionTestCase(unittest.TestCase):
             NatDivision.division([2], [1], 3, -1)
         with self.assertRaises(BasesError):
             NatDivision.division([3], [1], 10, 0, None)
+        with self.assertRaises(BasesError):
+            NatDivision.division_int(1, 3, 1)
+        with self.assertRaises(BasesError):
+            NatDivision.division_int(1, 3, 10, -1)
+        with self.assertRaises(BasesError):
+            NatDivision.division_int(-1, 3, 10)
+        with self.assertRaises(BasesError):
+            NatDivision.division_int(1, 0, 10)
+        with self.assertRaises(BasesError):
+            NatDivision.division_int(1, 3, 10, 0, None)
 
     def test_exceptions_undivision(self):
         """
@@ -61,3 +76,197 @@ class NatDivisionTestCase(unittest.TestCase):
             NatDivision.undivision([-1], [1], [1], 2)
         with self.assertRaises(BasesError):
             NatDivision.undivision([2], [1], [1], 2)
+        with self.assertRaises(BasesError):
+            NatDivision.undivision_int([1], [1], [2], 2)
+
+    def test_buffers(self):
+        """
+        Test that buffers of digits are accepted as arguments.
+        """
+        self.assertEqual(
+            NatDivision.division(bytes([3]), bytearray([1, 0]), 10),
+            ([3], [], [3], 0),
+        )
+        self.assertEqual(
+            NatDivision.undivision(bytes([3]), [], memoryview(bytes([3])), 10),
+            ([3], [1, 0]),
+        )
+        self.assertEqual(
+            NatDivision.undivision([1], bytes([2]), array.array("H", [5]), 10),
+            NatDivision.undivision([1], [2], [5], 10),
+        )
+
+    def test_long_period(self):
+        """
+        Test divisions with long periods.
+        """
+        divisor = Nats.convert_from_int(65537, 10)
+        (
+            integer_part,
+            non_repeating_part,
+            repeating_part,
+            relation,
+        ) = NatDivision.division(divisor, [1], 10)
+        self.assertEqual((integer_part, non_repeating_part, relation), ([], [], 0))
+        self.assertEqual(len(repeating_part), 65536)
+        self.assertEqual(
+            NatDivision.undivision([], [], repeating_part, 10), (divisor, [1])
+        )
+        self.assertEqual(
+            NatDivision.undivision_int([], [], repeating_part, 10), (65537, 1)
+        )
+
+        divisor = Nats.convert_from_int(2**20 * 3, 10)
+        (_, non_repeating_part, repeating_part, _) = NatDivision.division(
+            divisor, [1], 10
+        )
+        self.assertEqual((len(non_repeating_part), repeating_part), (20, [3]))
+        self.assertEqual(
+            NatDivision.division(divisor, [1], 10, 100000),
+            ([], non_repeating_part, repeating_part, 0),
+        )
+        self.assertEqual(
+            NatDivision.division(divisor, [1], 10, 20),
+            ([], non_repeating_part[:20], [], -1),
+        )
+
+        divisor = Nats.convert_from_int(2**20, 10)
+        self.assertEqual(
+            NatDivision.division(divisor, [1], 10, 100000),
+            ([], 6 * [0] + Nats.convert_from_int(5**20, 10), [], 0),
+        )
+
+    def test_periods(self):
+        """
+        Test divisions whose periods are found from the divisor.
+        """
+        divisor = Nats.convert_from_int(2**1279 - 1, 2)
+        self.assertEqual(
+            NatDivision.division(divisor, [1], 2), ([], [], 1278 * [0] + [1], 0)
+        )
+
+        divisor = Nats.convert_from_int(7 * 3**4 * 2**5, 10)
+        (_, non_repeating_part, repeating_part, _) = NatDivision.division(
+            divisor, [1], 10
+        )
+        self.assertEqual((len(non_repeating_part), len(repeating_part)), (5, 18))
+
+        divisor = Nats.convert_from_int(999983 * 999979, 10)
+        dividend = Nats.convert_from_int(999979 * 7, 10)
+        (_, non_repeating_part, repeating_part, _) = NatDivision.division(
+            divisor, dividend, 10
+        )
+        self.assertEqual((len(non_repeating_part), len(repeating_part)), (0, 999982))
+
+    def test_blocks(self):
+        """
+        Test divisions long enough to be computed in blocks of digits.
+        """
+        for (base, divisor) in ((16, 1019), (10, 7**60), (256, 3**100)):
+            dividend = 11**400
+            (
+                integer_part,
+                non_repeating_part,
+                repeating_part,
+                relation,
+            ) = NatDivision.division(
+                Nats.convert_from_int(divisor, base),
+                Nats.convert_from_int(dividend, base),
+                base,
+                300,
+            )
+            self.assertEqual(
+                integer_part, Nats.convert_from_int(dividend // divisor, base)
+            )
+            fraction = (dividend % divisor) * base**300 // divisor
+            digits = Nats.convert_from_int(fraction, base)
+            self.assertEqual(non_repeating_part, (300 - len(digits)) * [0] + digits)
+            self.assertEqual((repeating_part, relation), ([], -1))
+
+    def test_iter_digits(self):
+        """
+        Test generating fractional digits.
+        """
+        self.assertEqual(list(NatDivision.iter_digits([6], [1, 3], 10)), [1, 6])
+        self.assertEqual(list(NatDivision.iter_digits([8], [1], 10)), [1, 2, 5])
+        self.assertEqual(list(NatDivision.iter_digits([5], [1, 0], 10)), [])
+
+        self.assertEqual(NatDivision.iter_digits([6], [1, 3], 10).cycle_start, 1)
+        self.assertEqual(NatDivision.iter_digits([7], [1], 10).cycle_start, 0)
+        self.assertIsNone(NatDivision.iter_digits([8], [1], 10).cycle_start)
+        self.assertIsNone(NatDivision.iter_digits([5], [1, 0], 10).cycle_start)
+
+        digits = NatDivision.iter_digits(
+            Nats.convert_from_int(10**9 + 7, 10), [1], 10
+        )
+        self.assertEqual(
+            list(itertools.islice(digits, 12)), [0, 0, 0, 0, 0, 0, 0, 0, 0, 9, 9, 9]
+        )
+
+        with self.assertRaises(BasesError):
+            NatDivision.iter_digits([0], [1], 10)
+        with self.assertRaises(BasesError):
+            NatDivision.iter_digits([1], [10], 10)
+        with self.assertRaises(BasesError):
+            NatDivision.iter_digits([1], [1], 1)
+
+    def test_fractional_digits(self):
+        """
+        Test getting fractional digits at some index.
+        """
+        divisor = Nats.convert_from_int(10**9 + 7, 10)
+        (_, non_repeating_part, repeating_part, _) = NatDivision.division(
+            divisor, [1], 10, 1000
+        )
+        self.assertEqual(
+            NatDivision.fractional_digits(divisor, [1], 10, 990, 10),
+            non_repeating_part[990:],
+        )
+        self.assertEqual(repeating_part, [])
+        self.assertEqual(NatDivision.fractional_digits([7], [1, 5], 10, 6), [1])
+        self.assertEqual(
+            NatDivision.fractional_digits([8], [1], 10, 10**20, 3), [0, 0, 0]
+        )
+        self.assertEqual(NatDivision.fractional_digits([3], [1], 10, 10**20, 0), [])
+
+        with self.assertRaises(BasesError):
+            NatDivision.fractional_digits([3], [1], 10, -1)
+        with self.assertRaises(BasesError):
+            NatDivision.fractional_digits([3], [1], 10, 0, -1)
+        with self.assertRaises(BasesError):
+            NatDivision.fractional_digits([0], [1], 10, 0)
+
+    def test_lazy_import(self):
+        """
+        Test that importing justbases does not import the process pool.
+        """
+        env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+        result = subprocess.run(
+            [
+                sys.executable,
+                "-c",
+                "import sys, justbases; sys.exit('concurrent.futures' in sys.modules)",
+            ],
+            env=env,
+            check=False,
+        )
+        self.assertEqual(result.returncode, 0)
+
+    def test_parallel_division(self):
+        """
+        Test division with digits computed by a pool of processes.
+        """
+        for (divisor, dividend) in ((7, 1), (12 * 97, 10**30), (8, 15), (3, 3)):
+            divisor = Nats.convert_from_int(divisor, 10)
+            dividend = Nats.convert_from_int(dividend, 10)
+            self.assertEqual(
+                NatDivision.parallel_division(divisor, dividend, 10, 2, 7),
+                NatDivision.division(divisor, dividend, 10),
+            )
+
+        with self.assertRaises(BasesError):
+            NatDivision.parallel_division([3], [1], 10, 0)
+        with self.assertRaises(BasesError):
+            NatDivision.parallel_division([3], [1], 10, 2, 0)
+        with self.assertRaises(BasesError):
+            NatDivision.parallel_division([0], [1], 10)
@@ -19,6 +19,7 @@
 """ Test for integer conversions. """
 
 # isort: STDLIB
+import array
 import unittest
 
 # isort: LOCAL
@@ -48,3 +49,153 @@ class NatsTestCase(unittest.TestCase):
             Nats.carry_in([1], -1, 2)
         with self.assertRaises(BasesError):
             Nats.carry_in([1], 1, 1)
+
+    def test_from_int_large(self):
+        """Test converting values large enough to be split recursively."""
+        value = 7**5000
+        self.assertEqual(Nats.convert_from_int(value, 7), [1] + 5000 * [0])
+        self.assertEqual(Nats.convert_from_int(value - 1, 7), 5000 * [6])
+        self.assertEqual(Nats.convert_from_int(value, 10), [int(x) for x in str(value)])
+
+    def test_to_int_large(self):
+        """Test converting sequences long enough to be split recursively."""
+        value = 7**5000
+        self.assertEqual(Nats.convert_to_int([1] + 5000 * [0], 7), value)
+        self.assertEqual(Nats.convert_to_int(5000 * [6], 7), value - 1)
+        self.assertEqual(Nats.convert_to_int([int(x) for x in str(value)], 10), value)
+
+    def test_power_of_two_bases(self):
+        """Test conversions in bases that are powers of 2."""
+        value = 0xDEADBEEF
+        self.assertEqual(
+            Nats.convert_from_int(value, 16), [13, 14, 10, 13, 11, 14, 14, 15]
+        )
+        self.assertEqual(Nats.convert_from_int(value, 256), [222, 173, 190, 239])
+        self.assertEqual(Nats.convert_from_int(value, 2**16), [57005, 48879])
+        self.assertEqual(
+            Nats.convert_from_int(value, 8), [int(x) for x in oct(value)[2:]]
+        )
+        self.assertEqual(Nats.convert_from_int(value, 4)[:4], [3, 1, 3, 2])
+        self.assertEqual(Nats.convert_to_int([0, 13, 14, 10, 13], 16), 0xDEAD)
+        self.assertEqual(Nats.convert_to_int([0, 222, 173], 256), 0xDEAD)
+        self.assertEqual(Nats.convert_to_int([57005, 48879], 2**16), value)
+        self.assertEqual(Nats.convert_to_int([31, 31], 32), 1023)
+        for bits in range(1, 12):
+            self.assertEqual(Nats.convert_from_int(0, 2**bits), [])
+            self.assertEqual(Nats.convert_to_int([], 2**bits), 0)
+
+    def test_regroup(self):
+        """Test conversions between powers of a common root."""
+        self.assertEqual(Nats.convert([12, 3, 45], 100, 10), [1, 2, 0, 3, 4, 5])
+        self.assertEqual(Nats.convert([0, 0, 1, 2, 0, 3], 10, 100), [12, 3])
+        self.assertEqual(Nats.convert([8, 0, 2], 9, 27), [24, 2])
+        self.assertEqual(Nats.convert([24, 2], 27, 9), [8, 0, 2])
+        self.assertEqual(Nats.convert([0, 0], 27, 9), [])
+        self.assertEqual(Nats.convert([0, 7, 3], 10, 10), [7, 3])
+        with self.assertRaises(BasesError):
+            Nats.convert([100], 100, 10)
+
+    def test_convert_many(self):
+        """Test converting a batch of values."""
+        values = [[1, 0], [], [2, 5, 5], [1, 0], (0, 0, 1)]
+        results = Nats.convert_many(values, 10, 16)
+        self.assertEqual(results, [[10], [], [15, 15], [10], [1]])
+        self.assertIsNot(results[0], results[3])
+        self.assertEqual(Nats.convert_many([], 10, 16), [])
+        self.assertEqual(Nats.convert_many([40 * [99]], 100, 10), [80 * [9]])
+
+    def test_convert_many_exceptions(self):
+        """Test that a batch reports all its invalid values at once."""
+        with self.assertRaises(BasesError):
+            Nats.convert_many([[1]], 1, 2)
+        with self.assertRaises(BasesError):
+            Nats.convert_many([[1]], 2, 1)
+        with self.assertRaises(BasesError) as context:
+            Nats.convert_many([[1], [10], [2], [-1], [10]], 10, 2)
+        self.assertIn("[1, 3, 4]", str(context.exception))
+
+    def test_iterators(self):
+        """Test converting values that can be iterated over only once."""
+        self.assertEqual(Nats.convert_to_int(iter([3, 2]), 10), 32)
+        self.assertEqual(Nats.convert_to_int(iter([]), 10), 0)
+        self.assertEqual(
+            Nats.convert_to_int((9 for _ in range(1000)), 10), 10**1000 - 1
+        )
+        self.assertEqual(Nats.convert(iter([3, 2]), 10, 2), [1, 0, 0, 0, 0, 0])
+        with self.assertRaises(BasesError):
+            Nats.convert_to_int(iter(600 * [1] + [10]), 10)
+
+    def test_iter_convert(self):
+        """Test that digits are yielded before the value is exhausted."""
+
+        def digits(digit):
+            yield from 3 * [digit]
+            raise AssertionError("read too far")
+
+        result = Nats.iter_convert(digits(15), 16, 2)
+        self.assertEqual([next(result) for _ in range(8)], 8 * [1])
+
+        result = Nats.iter_convert(digits(1), 2, 8, 7)
+        self.assertEqual(next(result), 1)
+
+        self.assertEqual(list(Nats.iter_convert(iter([0, 1, 1]), 2, 8)), [3])
+        self.assertEqual(
+            list(Nats.iter_convert(iter([3, 2]), 10, 2)), [1, 0, 0, 0, 0, 0]
+        )
+
+    def test_iter_convert_exceptions(self):
+        """Test iter_convert exceptions."""
+        with self.assertRaises(BasesError):
+            Nats.iter_convert([1], 1, 2)
+        with self.assertRaises(BasesError):
+            Nats.iter_convert([1], 2, 1)
+        with self.assertRaises(BasesError):
+            Nats.iter_convert([1], 2, 8, -1)
+        with self.assertRaises(BasesError):
+            list(Nats.iter_convert([1, 1], 2, 8, 3))
+        with self.assertRaises(BasesError):
+            list(Nats.iter_convert([1, 1], 2, 8, 1))
+        with self.assertRaises(BasesError):
+            list(Nats.iter_convert([1, 2], 2, 8))
+
+    def test_buffers(self):
+        """Test conversions to and from buffers of digits."""
+        for digits in (
+            bytes([3, 1, 2]),
+            bytearray([3, 1, 2]),
+            array.array("H", [3, 1, 2]),
+            memoryview(array.array("I", [3, 1, 2])),
+        ):
+            self.assertEqual(Nats.convert_to_int(digits, 4), 54)
+            self.assertEqual(Nats.convert_to_int(digits, 256), 0x30102)
+            self.assertEqual(Nats.convert(digits, 4, 2), [1, 1, 0, 1, 1, 0])
+        self.assertEqual(
+            Nats.convert_to_int(array.array("H", 600 * [9]), 10), int(600 * "9")
+        )
+        with self.assertRaises(BasesError):
+            Nats.convert_to_int(bytes([3, 4]), 4)
+
+    def test_out(self):
+        """Test converting into a preallocated buffer."""
+        out = bytearray(4)
+        self.assertEqual(Nats.convert_from_int(54, 4, out=out), 3)
+        self.assertEqual(out, bytearray([3, 1, 2, 0]))
+        out = array.array("H", 4 * [0])
+        self.assertEqual(Nats.convert_from_int(54, 7, out=out), 3)
+        self.assertEqual(out.tolist(), [1, 0, 5, 0])
+        self.assertEqual(Nats.convert_from_int(0, 10, out=out), 0)
+        self.assertEqual(Nats.convert_from_int(2**16 - 1, 2**16, out=out), 1)
+        self.assertEqual(out[0], 2**16 - 1)
+
+    def test_out_exceptions(self):
+        """Test exceptions when converting into a buffer."""
+        with self.assertRaises(BasesError):
+            Nats.convert_from_int(54, 4, out=[0, 0, 0])
+        with self.assertRaises(BasesError):
+            Nats.convert_from_int(54, 4, out=bytes(3))
+        with self.assertRaises(BasesError):
+            Nats.convert_from_int(54, 4, out=array.array("b", 3 * [0]))
+        with self.assertRaises(BasesError):
+            Nats.convert_from_int(54, 4, out=bytearray(2))
+        with self.assertRaises(BasesError):
+            Nats.convert_from_int(54, 257, out=bytearray(3))
@@ -0,0 +1,76 @@
+# Copyright (C) 2015 - 2019 Red Hat, Inc.
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or any later version.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; If not, see <http://www.gnu.org/licenses/>.
+#
+# Red Hat Author(s): Anne Mulhern <amulhern@redhat.com>
+# Other Author(s): Anne Mulhern <mulhern@cs.wisc.edu>
+
+""" Test for lengths of parts of fractions. """
+
+# isort: STDLIB
+import unittest
+
+# isort: LOCAL
+from justbases import BasesError, Periods
+
+
+class PeriodsTestCase(unittest.TestCase):
+    """Tests for lengths of parts of fractions."""
+
+    def setUp(self):
+        Periods.clear()
+
+    def tearDown(self):
+        Periods.sieve()
+        Periods.set_max_bytes()
+        Periods.clear()
+
+    def test_exceptions(self):
+        """Test throwing exception."""
+        with self.assertRaises(BasesError):
+            Periods.set_max_bytes(-1)
+
+    def test_cache(self):
+        """Test that factorizations and orders are cached."""
+        modulus = 999983 * 999979
+        self.assertEqual(Periods.order(10, modulus), 999982 * 999978 // 6)
+        self.assertEqual(Periods.order(10, modulus, 10), None)
+        self.assertEqual(Periods.order(10 + modulus, modulus), 999982 * 999978 // 6)
+        (factors, orders) = Periods.info()
+        self.assertEqual((orders.hits, orders.misses, orders.entries), (2, 1, 1))
+        self.assertEqual(factors.misses, factors.entries)
+
+        factorization = Periods.factor(modulus)
+        factorization[2] += 1
+        self.assertEqual(Periods.factor(modulus), {999983: 1, 999979: 1})
+
+        Periods.set_max_bytes(0)
+        self.assertEqual(Periods.info()[1].entries, 0)
+
+    def test_wrong_factors(self):
+        """
+        Test that the order is found if a factorization is wrong.
+        """
+        modulus = 1009 * 2011
+        Periods._FACTORS.put(modulus, {modulus: 1})  # pylint: disable=protected-access
+        self.assertEqual(Periods.factor(modulus), {modulus: 1})
+        self.assertEqual(Periods.order(10, modulus), 84420)
+
+    def test_sieve(self):
+        """Test factoring by a sieve."""
+        factors = [Periods.factor(value) for value in range(1, 2000)]
+        Periods.clear()
+        Periods.sieve(1000)
+        self.assertEqual([Periods.factor(value) for value in range(1, 2000)], factors)
+        self.assertEqual(Periods.info()[0].misses, 1000)
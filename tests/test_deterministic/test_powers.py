@@ -0,0 +1,72 @@
+# Copyright (C) 2015 - 2019 Red Hat, Inc.
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or any later version.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; If not, see <http://www.gnu.org/licenses/>.
+#
+# Red Hat Author(s): Anne Mulhern <amulhern@redhat.com>
+# Other Author(s): Anne Mulhern <mulhern@cs.wisc.edu>
+
+""" Test for the cache of powers. """
+
+# isort: STDLIB
+import sys
+import unittest
+
+# isort: LOCAL
+from justbases import BasesError, Powers
+
+
+class PowersTestCase(unittest.TestCase):
+    """Tests for the cache of powers."""
+
+    def setUp(self):
+        Powers.clear()
+
+    def tearDown(self):
+        Powers.set_max_bytes()
+        Powers.clear()
+
+    def test_exceptions(self):
+        """Test throwing exception."""
+        with self.assertRaises(BasesError):
+            Powers.set_max_bytes(-1)
+
+    def test_power(self):
+        """Test that results are correct and are cached."""
+        self.assertEqual(Powers.power(10, 5), 10**5)
+        self.assertEqual(Powers.power(10, 5), 10**5)
+        self.assertEqual(Powers.repeated_square(3, 0), 3)
+        self.assertEqual(Powers.repeated_square(3, 4), 3**16)
+        info = Powers.info()
+        self.assertEqual((info.hits, info.misses, info.entries), (1, 5, 5))
+        self.assertEqual(Powers.repeated_square(3, 3), 3**8)
+        self.assertEqual(Powers.info().hits, 2)
+
+    def test_bound(self):
+        """Test that the least recently used values are evicted."""
+        size = sys.getsizeof(2**1000)
+        Powers.set_max_bytes(2 * size)
+        Powers.power(2, 1000)
+        Powers.power(3, 600)
+        Powers.power(2, 1000)
+        Powers.power(5, 400)
+        info = Powers.info()
+        self.assertEqual(info.entries, 2)
+        self.assertLessEqual(info.bytes, info.max_bytes)
+        Powers.power(2, 1000)
+        self.assertEqual(Powers.info().hits, 2)
+
+        Powers.set_max_bytes(0)
+        self.assertEqual(Powers.info().entries, 0)
+        self.assertEqual(Powers.power(2, 1000), 2**1000)
+        self.assertEqual(Powers.info().bytes, 0)
@@ -19,10 +19,13 @@
 """ Test for rational conversions. """
 
 # isort: STDLIB
+import array
+import copy
+import pickle
 import unittest
 
 # isort: LOCAL
-from justbases import BasesError, Radix, RoundingMethods
+from justbases import BasesError, FrozenRadix, Radices, Radix, RoundingMethods
 
 
 class RadixTestCase(unittest.TestCase):
@@ -60,6 +63,57 @@ class RadixTestCase(unittest.TestCase):
             Radix(1, [1], [], [], 2),
         )
 
+    def test_buffers(self):
+        """
+        Test radixes with buffers of digits as components.
+        """
+        radix = Radix(1, bytes([1, 2]), bytearray([3, 4]), bytes([5]), 10)
+        self.assertIsInstance(radix.integer_part, bytes)
+        self.assertEqual(radix, Radix(1, [1, 2], [3, 4], [5], 10))
+        self.assertEqual(
+            Radix(1, memoryview(bytes([1])), array.array("H", [2, 5, 6]), [5, 6], 10),
+            Radix(1, [1], [2], [5, 6], 10),
+        )
+        self.assertEqual(
+            Radix(1, bytes([0]), bytes([0]), bytes([9]), 10), Radix(1, [], [1], [], 10)
+        )
+        self.assertEqual(copy.deepcopy(radix), radix)
+        radix = Radix(1, memoryview(bytes([1])), [], [], 10)
+        self.assertEqual(copy.deepcopy(radix), radix)
+        self.assertEqual(radix.as_rational(), 1)
+
+    def test_pickle(self):
+        """
+        Test that radixes survive a round trip through every pickle protocol.
+        """
+        for radix_type in (Radix, FrozenRadix):
+            for value in (
+                radix_type(-1, [1, 2], [3], [4, 5], 10),
+                radix_type(1, bytes([1]), bytes([2]), [], 2**8),
+                radix_type(0, [], [], [], 3),
+            ):
+                for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+                    result = pickle.loads(pickle.dumps(value, protocol))
+                    self.assertIs(type(result), radix_type)
+                    self.assertEqual(result, value)
+                    self.assertEqual(result.integer_part, value.integer_part)
+
+    def test_as_rationals(self):
+        """
+        Test converting many radixes to rationals at once.
+        """
+        values = [
+            Radix(sign, [1, 2], [3], [value, 4], 10)
+            for sign in (-1, 1)
+            for value in range(10)
+        ]
+        values.append(Radix(1, bytes([1]), [], [2], 2**64))
+        values.append(Radix(0, [], [], [], 3))
+        self.assertEqual(
+            Radices.as_rationals(values), [value.as_rational() for value in values]
+        )
+        self.assertEqual(Radices.as_rationals([]), [])
+
     def test_in_equality(self):
         """
         Test != operator.
@@ -117,6 +171,69 @@ class RadixTestCase(unittest.TestCase):
         self.assertEqual(radix.non_repeating_part, [3, 3])
         self.assertEqual(radix.repeating_part, [2, 3, 1])
 
+    def test_long_repeating_part(self):
+        """
+        Long parts that almost repeat are canonicalized.
+        """
+        length = 5040
+        repeating_part = (length - 1) * [0] + [1]
+        radix = Radix(1, [], [2] + repeating_part, repeating_part, 3)
+        self.assertEqual(radix.non_repeating_part, [2])
+        self.assertEqual(radix.repeating_part, repeating_part)
+        radix = Radix(1, [], [0, 1, 0], (length // 2) * [1, 0], 2)
+        self.assertEqual(radix.non_repeating_part, [])
+        self.assertEqual(radix.repeating_part, [0, 1])
+
+
+class FrozenRadixTestCase(unittest.TestCase):
+    """Tests for immutable radixes."""
+
+    def test_immutable(self):
+        """
+        Test that attributes can not be set and that copies are shared.
+        """
+        radix = FrozenRadix(1, [1, 2], [3, 4], [5, 6], 10)
+        self.assertEqual(radix.non_repeating_part, (3, 4))
+        with self.assertRaises(BasesError):
+            radix.sign = -1
+        with self.assertRaises(BasesError):
+            del radix.base
+        with self.assertRaises(BasesError):
+            radix.other = 0  # pylint: disable=assigning-non-slot
+        with self.assertRaises(AttributeError):
+            Radix(1, [], [], [], 10).other = 0  # pylint: disable=assigning-non-slot
+        self.assertIs(copy.copy(radix), radix)
+        self.assertIs(copy.deepcopy(radix), radix)
+        self.assertIs(radix.frozen(), radix)
+        self.assertIs(radix.in_base(10), radix)
+        self.assertIsInstance(radix.in_base(7), FrozenRadix)
+        self.assertEqual(pickle.loads(pickle.dumps(radix)), radix)
+
+    def test_repr(self):
+        """
+        Test that the representation names the type of the value.
+        """
+        self.assertEqual(
+            repr(FrozenRadix(1, [1], [2], [3], 10)), "FrozenRadix(1,(1,),(2,),(3,),10)"
+        )
+        self.assertEqual(repr(Radix(1, [1], [2], [3], 10)), "Radix(1,[1],[2],[3],10)")
+
+    def test_hash(self):
+        """
+        Test that equal values hash the same, whatever holds their digits.
+        """
+        radix = Radix(1, [1], [2], [3, 4, 3, 4], 10)
+        frozen = radix.frozen()
+        self.assertEqual(frozen, radix)
+        self.assertEqual(frozen.repeating_part, (3, 4))
+        self.assertEqual(
+            hash(frozen), hash(FrozenRadix(1, bytes([1]), bytes([2]), [3, 4], 10))
+        )
+        values = {frozen: 0, FrozenRadix(1, [1], [2], [3, 4], 10): 1}
+        self.assertEqual(len(values), 1)
+        with self.assertRaises(TypeError):
+            hash(radix)
+
 
 class RoundingTestCase(unittest.TestCase):
     """Tests for rounding Radixes."""
@@ -129,3 +246,24 @@ class RoundingTestCase(unittest.TestCase):
             Radix(0, [], [], [], 2).rounded(-1, RoundingMethods.ROUND_DOWN)
         with self.assertRaises(BasesError):
             Radix(0, [], [], [], 2).rounded(0, None)
+
+    def test_halves(self):
+        """
+        Test rounding at and near one half in even and odd bases.
+        """
+        method = RoundingMethods.ROUND_HALF_DOWN
+        cases = [
+            (Radix(1, [], [5], [], 10), 0, ([], [], -1)),
+            (Radix(1, [], [5, 0, 1], [], 10), 0, ([1], [], 1)),
+            (Radix(1, [], [4], [9, 8], 10), 0, ([], [], -1)),
+            (Radix(1, [], [], [1], 3), 0, ([], [], -1)),
+            (Radix(1, [], [1, 1], [1, 2], 3), 0, ([1], [], 1)),
+            (Radix(1, [], [1, 1], [1, 0], 3), 0, ([], [], -1)),
+            (Radix(1, [], [2], [1], 3), 1, ([], [2], -1)),
+            (Radix(1, [], [1], [2, 1], 3), 1, ([], [2], 1)),
+        ]
+        for (value, precision, (integer_part, non_repeating_part, relation)) in cases:
+            (result, rel) = value.rounded(precision, method)
+            self.assertEqual(result.integer_part, integer_part)
+            self.assertEqual(result.non_repeating_part, non_repeating_part)
+            self.assertEqual(rel, relation)
@@ -23,7 +23,14 @@ import unittest
 from fractions import Fraction
 
 # isort: LOCAL
-from justbases import BasesError, Radices, Rationals
+from justbases import (
+    BasesError,
+    CachePolicies,
+    Radices,
+    Radix,
+    Rationals,
+    RoundingMethods,
+)
 
 
 class RationalsTestCase(unittest.TestCase):
@@ -37,6 +44,85 @@ class RationalsTestCase(unittest.TestCase):
             Radices.from_rational(Fraction(1, 2), 0)
         with self.assertRaises(BasesError):
             Radices.from_rational(Fraction(1, 2), 2, -1)
+        with self.assertRaises(BasesError):
+            Radices.from_rational(Fraction(1, 2), 2, 1, None)
+
+    def test_precision(self):
+        """
+        Test conversions rounded to a precision.
+        """
+        self.assertEqual(
+            Radices.from_rational(
+                Fraction(-1, 8), 10, 2, RoundingMethods.ROUND_HALF_UP
+            ),
+            (Radix(-1, [], [1, 2], [], 10), 1),
+        )
+        self.assertEqual(
+            Radices.from_rational(Fraction(1, 8), 10, 2, RoundingMethods.ROUND_HALF_UP),
+            (Radix(1, [], [1, 3], [], 10), 1),
+        )
+        self.assertEqual(
+            Radices.from_rational(
+                Fraction(1, 8), 10, 2, RoundingMethods.ROUND_HALF_ZERO
+            ),
+            (Radix(1, [], [1, 2], [], 10), -1),
+        )
+        self.assertEqual(
+            Radices.from_rational(Fraction(999, 100), 10, 1, RoundingMethods.ROUND_UP),
+            (Radix(1, [1, 0], [0], [], 10), 1),
+        )
+        self.assertEqual(
+            Radices.from_rational(
+                Fraction(-1, 1000), 10, 2, RoundingMethods.ROUND_TO_ZERO
+            ),
+            (Radix(0, [], [0, 0], [], 10), 1),
+        )
+        self.assertEqual(
+            Radices.from_rational(Fraction(1, 4), 2, 3),
+            (Radix(1, [], [0, 1, 0], [], 2), 0),
+        )
+
+    def test_cache(self):
+        """
+        Test that results are cached and shared.
+        """
+        Radices.set_cache(2**16, CachePolicies.LFU)
+        try:
+            first = Radices.from_rational(
+                Fraction(-1, 3), 10, 2, RoundingMethods.ROUND_UP
+            )
+            second = Radices.from_rational(
+                Fraction(-1, 3), 10, 2, RoundingMethods.ROUND_UP
+            )
+            self.assertIs(first, second)
+            self.assertEqual(first, (Radix(-1, [], [3, 3], [], 10), 1))
+            self.assertIsInstance(first[0].non_repeating_part, tuple)
+            with self.assertRaises(BasesError):
+                first[0].sign = 1
+            self.assertEqual(
+                Radices.from_rational(Fraction(-1, 3), 10, 2, RoundingMethods.ROUND_UP),
+                (Radix(-1, [], [3, 3], [], 10), 1),
+            )
+            self.assertNotEqual(Radices.from_rational(Fraction(-1, 3), 10), first)
+            info = Radices.cache_info()
+            self.assertEqual((info.hits, info.misses, info.entries), (2, 2, 2))
+            Radices.clear_cache()
+            self.assertEqual(Radices.cache_info().entries, 0)
+        finally:
+            Radices.set_cache()
+        self.assertEqual(Radices.cache_info().max_bytes, 0)
+
+    def test_uncached(self):
+        """
+        Test that results are not frozen if the cache is disabled.
+        """
+        (result, _) = Radices.from_rational(Fraction(1, 3), 10)
+        self.assertIs(type(result), Radix)
+        self.assertEqual(result.repeating_part, [3])
+        result.repeating_part.append(3)
+        self.assertEqual(
+            Radices.from_rational(Fraction(1, 3), 10)[0].repeating_part, [3]
+        )
 
     def test_rounding_exceptions(self):
         """
@@ -45,3 +131,19 @@ class RationalsTestCase(unittest.TestCase):
         # pylint: disable=pointless-statement
         with self.assertRaises(BasesError):
             Rationals.round_to_int(Fraction(1, 2), None)
+
+    def test_round_to_int_halves(self):
+        """Test rounding values at and near one half, of either sign."""
+        cases = [
+            (Fraction(5, 2), RoundingMethods.ROUND_HALF_UP, (3, 1)),
+            (Fraction(5, 2), RoundingMethods.ROUND_HALF_DOWN, (2, -1)),
+            (Fraction(5, 2), RoundingMethods.ROUND_HALF_ZERO, (2, -1)),
+            (Fraction(-5, 2), RoundingMethods.ROUND_HALF_UP, (-2, 1)),
+            (Fraction(-5, 2), RoundingMethods.ROUND_HALF_DOWN, (-3, -1)),
+            (Fraction(-5, 2), RoundingMethods.ROUND_HALF_ZERO, (-2, 1)),
+            (Fraction(-7, 3), RoundingMethods.ROUND_HALF_ZERO, (-2, 1)),
+            (Fraction(-8, 3), RoundingMethods.ROUND_HALF_ZERO, (-3, -1)),
+            (Fraction(-7, 3), RoundingMethods.ROUND_TO_ZERO, (-2, 1)),
+        ]
+        for (value, method, expected) in cases:
+            self.assertEqual(Rationals.round_to_int(value, method), expected)
@@ -0,0 +1,99 @@
+# Copyright (C) 2015 - 2019 Red Hat, Inc.
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or any later version.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; If not, see <http://www.gnu.org/licenses/>.
+#
+# Red Hat Author(s): Anne Mulhern <amulhern@redhat.com>
+# Other Author(s): Anne Mulhern <mulhern@cs.wisc.edu>
+
+""" Test for conversions of arrays. """
+
+# isort: STDLIB
+import unittest
+from os import sys
+
+# isort: THIRDPARTY
+from hypothesis import given, settings, strategies
+
+# isort: LOCAL
+from justbases import NatArrays, NatDivision, Nats
+
+try:
+    # isort: THIRDPARTY
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
+
+if sys.gettrace() is not None:
+    settings.load_profile("tracing")
+
+
+_MATRIX_STRATEGY = strategies.tuples(
+    strategies.integers(min_value=2, max_value=2**16),
+    strategies.integers(min_value=0, max_value=8),
+    strategies.integers(min_value=0, max_value=48),
+).flatmap(
+    lambda t: strategies.tuples(
+        strategies.lists(
+            strategies.lists(
+                strategies.integers(min_value=0, max_value=t[0] - 1),
+                min_size=t[2],
+                max_size=t[2],
+            ),
+            min_size=t[1],
+            max_size=t[1],
+        ),
+        strategies.just(t[0]),
+        strategies.just(t[2]),
+    )
+)
+
+
+@unittest.skipIf(numpy is None, "NumPy is not installed")
+class NatArraysTestCase(unittest.TestCase):
+    """Tests for arrays of ints."""
+
+    @given(_MATRIX_STRATEGY)
+    @settings(max_examples=500, deadline=None)
+    def test_convert_to_int(self, strategy):
+        """Converting a matrix agrees with converting each row."""
+        (rows, from_base, columns) = strategy
+        dtype = numpy.uint8 if from_base <= 256 else numpy.uint16
+        value = numpy.array(rows, dtype=dtype).reshape(len(rows), columns)
+        self.assertEqual(
+            NatArrays.convert_to_int(value, from_base),
+            [Nats.convert_to_int(row, from_base) for row in rows],
+        )
+
+    @given(
+        strategies.lists(
+            strategies.tuples(
+                strategies.integers(min_value=0, max_value=2**64),
+                strategies.integers(min_value=1, max_value=2**12),
+            ),
+            max_size=32,
+        ),
+        strategies.integers(min_value=2, max_value=64),
+    )
+    @settings(max_examples=200, deadline=None)
+    def test_division_int(self, pairs, base):
+        """Dividing a batch agrees with dividing each pair."""
+        numerators = [numerator for (numerator, _) in pairs]
+        denominators = [denominator for (_, denominator) in pairs]
+        self.assertEqual(
+            NatArrays.division_int(numerators, denominators, base),
+            [
+                NatDivision.division_int(numerator, denominator, base)
+                for (numerator, denominator) in pairs
+            ],
+        )
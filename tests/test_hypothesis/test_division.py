@@ -200,3 +200,76 @@ class NatDivisionTestCase(unittest.TestCase):
                     self.assertEqual(rounded_int, round_down_int)
                 else:
                     self.assertEqual(rounded_int, round_up_int)
+
+    @given(_DIVISION_STRATEGY)
+    @settings(max_examples=500, deadline=None)
+    def test_iter_digits(self, strategy):
+        """
+        Test that generated digits are the fractional digits of division and
+        that the iterator gives the start of the repeating part.
+        """
+        (divisor, dividend, base) = strategy
+        (_, non_repeating_part, repeating_part, _) = NatDivision.division(
+            divisor, dividend, base
+        )
+
+        digits = []
+        generator = NatDivision.iter_digits(divisor, dividend, base)
+        try:
+            while True:
+                digits.append(next(generator))
+        except StopIteration as stop:
+            start = stop.value
+
+        self.assertEqual(digits, non_repeating_part + repeating_part)
+        self.assertEqual(
+            start, len(non_repeating_part) if repeating_part != [] else None
+        )
+        self.assertEqual(generator.cycle_start, start)
+        self.assertEqual(
+            list(NatDivision.iter_digits(divisor, dividend, base)), digits
+        )
+
+    @given(
+        _DIVISION_STRATEGY,
+        strategies.integers(min_value=0, max_value=64),
+        strategies.integers(min_value=0, max_value=8),
+    )
+    @settings(max_examples=500, deadline=None)
+    def test_fractional_digits(self, strategy, index, count):
+        """
+        Test that digits at some index are those computed by division.
+        """
+        (divisor, dividend, base) = strategy
+        (_, non_repeating_part, repeating_part, _) = NatDivision.division(
+            divisor, dividend, base, index + count, RoundingMethods.ROUND_DOWN
+        )
+        digits = non_repeating_part + repeating_part * (index + count)
+        digits += (index + count - len(digits)) * [0]
+
+        self.assertEqual(
+            NatDivision.fractional_digits(divisor, dividend, base, index, count),
+            digits[index : index + count],
+        )
+
+    @given(
+        _DIVISION_STRATEGY,
+        strategies.one_of(strategies.none(), strategies.integers(0, 8)),
+        strategies.sampled_from(RoundingMethods.METHODS()),
+    )
+    @settings(max_examples=500, deadline=None)
+    def test_division_int(self, strategy, precision, method):
+        """
+        Test that division of ints is the same as division of digits.
+        """
+        (divisor, dividend, base) = strategy
+        self.assertEqual(
+            NatDivision.division_int(
+                Nats.convert_to_int(dividend, base),
+                Nats.convert_to_int(divisor, base),
+                base,
+                precision,
+                method,
+            ),
+            NatDivision.division(divisor, dividend, base, precision, method),
+        )
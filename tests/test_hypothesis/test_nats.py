@@ -19,6 +19,7 @@
 """ Test for integer conversions. """
 
 # isort: STDLIB
+import array
 import unittest
 from os import sys
 
@@ -62,6 +63,60 @@ class NatsTestCase(unittest.TestCase):
         self.assertNotEqual(result[:1], [0])
         self.assertEqual(Nats.convert_to_int(result, to_base), value)
 
+    @given(
+        strategies.integers(min_value=0, max_value=2**4000),
+        strategies.integers(min_value=2, max_value=2**16),
+    )
+    @settings(max_examples=100, deadline=None)
+    def test_buffers(self, value, to_base):
+        """
+        Converting into a buffer yields the same digits as converting to a
+        list, and the buffer converts back to value.
+        """
+        result = Nats.convert_from_int(value, to_base)
+        out = array.array("B" if to_base <= 256 else "H", (len(result) + 1) * [0])
+        self.assertEqual(Nats.convert_from_int(value, to_base, out=out), len(result))
+        self.assertEqual(out[: len(result)].tolist(), result)
+        self.assertEqual(Nats.convert_to_int(out[: len(result)], to_base), value)
+
+    @given(
+        strategies.integers(min_value=2**2048, max_value=2**20000),
+        strategies.integers(min_value=2, max_value=2**70),
+    )
+    @settings(max_examples=50, deadline=None)
+    def test_from_int_large(self, value, to_base):
+        """
+        Roundtrip holds for values large enough to be converted by
+        divide-and-conquer.
+        """
+        result = Nats.convert_from_int(value, to_base)
+        self.assertNotEqual(result[:1], [0])
+        self.assertEqual(Nats.convert_to_int(result, to_base), value)
+
+    @given(
+        strategies.integers(min_value=2, max_value=2**70).flatmap(
+            lambda n: strategies.tuples(
+                strategies.lists(
+                    strategies.integers(min_value=0, max_value=n - 1),
+                    min_size=257,
+                    max_size=2000,
+                ),
+                strategies.just(n),
+            )
+        )
+    )
+    @settings(max_examples=50, deadline=None)
+    def test_to_int_large(self, nat):
+        """
+        Sequences long enough to be converted by divide-and-conquer agree
+        with digit-at-a-time evaluation.
+        """
+        (subject, from_base) = nat
+        expected = 0
+        for digit in subject:
+            expected = expected * from_base + digit
+        self.assertEqual(Nats.convert_to_int(subject, from_base), expected)
+
     @given(_NATS_STRATEGY, strategies.integers(min_value=2, max_value=64))
     @settings(max_examples=500)
     def test_from_other(self, nat, to_base):
@@ -73,6 +128,85 @@ class NatsTestCase(unittest.TestCase):
             Nats.convert_to_int(subject, from_base),
         )
 
+    @given(
+        strategies.integers(min_value=0, max_value=2**4096),
+        strategies.integers(min_value=1, max_value=70),
+    )
+    @settings(max_examples=500)
+    def test_power_of_two_bases(self, value, bits):
+        """
+        Conversions in bases that are powers of 2 agree with the digit
+        values obtained by shifting and masking.
+        """
+        base = 2**bits
+        expected = []
+        remaining = value
+        while remaining != 0:
+            expected.append(remaining & (base - 1))
+            remaining >>= bits
+        expected.reverse()
+        self.assertEqual(Nats.convert_from_int(value, base), expected)
+        self.assertEqual(Nats.convert_to_int([0] + expected, base), value)
+
+    _ROOTS_STRATEGY = strategies.tuples(
+        strategies.integers(min_value=3, max_value=12),
+        strategies.integers(min_value=1, max_value=6),
+        strategies.integers(min_value=1, max_value=6),
+    ).flatmap(
+        lambda t: strategies.tuples(
+            build_nat(t[0] ** t[1], 64),
+            strategies.just(t[0] ** t[1]),
+            strategies.just(t[0] ** t[2]),
+        )
+    )
+
+    @given(_ROOTS_STRATEGY)
+    @settings(max_examples=500)
+    def test_from_power_related(self, strategy):
+        """
+        Conversion between bases that are powers of a common root agrees
+        with conversion through an int.
+        """
+        (subject, from_base, to_base) = strategy
+        self.assertEqual(
+            Nats.convert(subject, from_base, to_base),
+            Nats.convert_from_int(Nats.convert_to_int(subject, from_base), to_base),
+        )
+
+    @given(
+        strategies.integers(min_value=2, max_value=64).flatmap(
+            lambda n: strategies.tuples(
+                strategies.lists(build_nat(n, 64), max_size=16),
+                strategies.just(n),
+            )
+        ),
+        strategies.integers(min_value=2, max_value=64),
+    )
+    @settings(max_examples=500)
+    def test_convert_many(self, nats, to_base):
+        """Converting a batch agrees with converting each value."""
+        (subjects, from_base) = nats
+        subjects = subjects + subjects[:2]
+        self.assertEqual(
+            Nats.convert_many(subjects, from_base, to_base),
+            [Nats.convert(subject, from_base, to_base) for subject in subjects],
+        )
+
+    @given(_NATS_STRATEGY, strategies.integers(min_value=2, max_value=64))
+    @settings(max_examples=500)
+    def test_iter_convert(self, nat, to_base):
+        """Converting an iterator agrees with converting a sequence."""
+        (subject, from_base) = nat
+        expected = Nats.convert(subject, from_base, to_base)
+        self.assertEqual(Nats.convert(iter(subject), from_base, to_base), expected)
+        self.assertEqual(
+            list(Nats.iter_convert(iter(subject), from_base, to_base)), expected
+        )
+        self.assertEqual(
+            list(Nats.iter_convert(iter(subject), from_base, to_base, len(subject))),
+            expected,
+        )
+
     _CARRY_STRATEGY = strategies.integers(min_value=2).flatmap(
         lambda n: strategies.tuples(
             build_nat(n, 64),